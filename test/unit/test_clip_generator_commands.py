@@ -0,0 +1,123 @@
+"""
+Unit tests for the ffmpeg command lines built by ClipGenerator.
+
+ffmpeg is never run: subprocess.run is replaced where a command would execute.
+
+Run with: python -m pytest test/unit/test_clip_generator_commands.py
+"""
+
+import subprocess
+
+import pytest
+
+from verityngn.services.video import clip_generator as cg
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    """A ClipGenerator with an ffmpeg build listing only h264_nvenc and no failed encoders."""
+    monkeypatch.setattr(cg.ClipGenerator, "_ffmpeg_encoders", " V....D h264_nvenc  NVIDIA NVENC H.264 encoder\n")
+    monkeypatch.setattr(cg.ClipGenerator, "_failed_hw_encoders", set())
+    return cg.ClipGenerator(cg.ClipConfig(hw_accel="auto"))
+
+
+def test_auto_picks_listed_hardware_encoder(generator):
+    assert generator._clip_encoder_args() == ["-hwaccel", "cuda", "-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll"]
+
+
+def test_x264_used_without_hardware_encoders(generator, monkeypatch):
+    monkeypatch.setattr(cg.ClipGenerator, "_ffmpeg_encoders", " V....D libx264  H.264\n")
+    args = generator._clip_encoder_args()
+    assert args == generator._x264_encoder_args()
+    assert args[:4] == ["-c:v", "libx264", "-preset", "ultrafast"]
+    assert generator.config.x264_tune in args
+
+
+def test_extract_cmd_seeks_twice_and_keeps_input_options_before_input(generator):
+    cmd = generator._clip_extract_cmd("in.mp4", "out.mp4", 10.0, 12.0, generator._clip_encoder_args())
+    assert cmd[:4] == ["ffmpeg", "-y", "-hwaccel", "cuda"]
+    input_index = cmd.index("-i")
+    assert cmd[input_index - 2:input_index] == ["-ss", "8.0"]
+    assert cmd[input_index + 1:input_index + 7] == ["in.mp4", "-ss", "2.0", "-t", "12.0", "-c:v"]
+    assert cmd[-1] == "out.mp4"
+    # Near the start of the video there is nothing to seek past coarsely
+    cmd = generator._clip_extract_cmd("in.mp4", "out.mp4", 1.0, 12.0, generator._x264_encoder_args())
+    assert cmd[2:4] == ["-ss", "0.0"] and cmd[cmd.index("-i") + 2:cmd.index("-i") + 4] == ["-ss", "1.0"]
+
+
+def test_failed_hardware_encoder_is_not_tried_again(generator, monkeypatch, tmp_path):
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        if "h264_nvenc" in cmd:
+            return subprocess.CompletedProcess(cmd, 1, "", "No NVENC capable devices found")
+        open(cmd[-1], "wb").close()
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(cg.subprocess, "run", fake_run)
+    claim = {"timestamp": "00:30", "claim_text": "claim"}
+    assert generator.extract_claim_clip_ffmpeg("video.mp4", claim, str(tmp_path), 1) is not None
+    assert ["h264_nvenc" in cmd for cmd in commands] == [True, False]
+    assert "h264_nvenc" in cg.ClipGenerator._failed_hw_encoders
+
+    commands.clear()
+    assert generator.extract_claim_clip_ffmpeg("video.mp4", claim, str(tmp_path), 2) is not None
+    assert len(commands) == 1 and "libx264" in commands[0]
+
+
+def test_source_failure_does_not_disable_hardware_encoder(generator, monkeypatch, tmp_path):
+    monkeypatch.setattr(cg.subprocess, "run", lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, "", "bad input"))
+    assert generator.extract_claim_clip_ffmpeg("video.mp4", {"timestamp": "00:30"}, str(tmp_path), 1) is None
+    assert cg.ClipGenerator._failed_hw_encoders == set()
+
+
+def test_filter_escape_survives_both_parsing_levels():
+    assert cg._filter_escape("a:b") == r"a\\:b"
+    assert cg._filter_escape("x,y[z];'q'") == r"x\,y\[z\]\;\\\'q\\\'"
+
+
+def _overlay_command(generator, monkeypatch, tmp_path, buildconf="--enable-libfontconfig"):
+    """Run add_text_overlay_to_clip with ffmpeg/ffprobe replaced; return the ffmpeg command."""
+    monkeypatch.setattr(cg.ClipGenerator, "_ffmpeg_buildconf", buildconf)
+    monkeypatch.setattr(generator, "_probe_video", lambda path: (1280, 720, 12.0))
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(cg.subprocess, "run", fake_run)
+    out = str(tmp_path / "out.mp4")
+    assert generator.add_text_overlay_to_clip("clip.mp4", "It cures: everything, 100%", "LIKELY_FALSE", out) == out
+    assert len(commands) == 1
+    return commands[0]
+
+
+def test_overlay_is_one_ffmpeg_pass_with_x264_options(generator, monkeypatch, tmp_path):
+    cmd = _overlay_command(generator, monkeypatch, tmp_path)
+    vf = cmd[cmd.index("-vf") + 1]
+    assert vf.count("drawtext=") == 2 and vf.count("drawbox=") == 1
+    assert r"font=Arial\\:style=Bold:textfile=" in vf
+    assert r"between(t\,3.000\,9.000)" in vf
+    assert cmd[cmd.index("-c:v") + 1:cmd.index("-c:a")] == [
+        "libx264", "-preset", "ultrafast", "-tune", generator.config.x264_tune]
+
+
+def test_overlay_passes_no_x264_preset_to_other_codecs(generator, monkeypatch, tmp_path):
+    generator.config.output_codec = "h264_videotoolbox"
+    cmd = _overlay_command(generator, monkeypatch, tmp_path)
+    assert "-preset" not in cmd and "-tune" not in cmd
+    assert cmd[cmd.index("-c:v") + 1] == "h264_videotoolbox"
+
+
+def test_overlay_uses_font_file_without_fontconfig(generator, monkeypatch, tmp_path):
+    monkeypatch.setattr(cg, "_drawtext_fallback_font_file", lambda font: "/fonts/DejaVuSans-Bold.ttf")
+    vf = _overlay_command(generator, monkeypatch, tmp_path, buildconf="--enable-libfreetype")
+    vf = vf[vf.index("-vf") + 1]
+    assert "drawtext=fontfile=/fonts/DejaVuSans-Bold.ttf:textfile=" in vf
+    assert "font=Arial" not in vf
+
+    monkeypatch.setattr(cg, "_drawtext_fallback_font_file", lambda font: None)
+    vf = _overlay_command(generator, monkeypatch, tmp_path, buildconf="--enable-libfreetype")
+    assert "drawtext=textfile=" in vf[vf.index("-vf") + 1]
@@ -0,0 +1,184 @@
+"""
+Unit tests for the short-lived caches in the storage services.
+
+GCS is replaced by a small in-memory bucket defined here; no requests are made.
+
+Run with: python -m pytest test/unit/test_storage_caches.py
+"""
+
+import contextlib
+
+import pytest
+
+from verityngn.services.storage import gcs, unified_storage
+
+
+class _FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    def generate_signed_url(self, version, expiration, method):
+        self.bucket.signed.append((self.name, expiration.total_seconds()))
+        return f"https://signed/{self.name}?n={len(self.bucket.signed)}"
+
+    def upload_from_string(self, data, content_type=None):
+        self.bucket.objects[self.name] = data
+
+    def delete(self):
+        del self.bucket.objects[self.name]
+
+
+class _FakeBucket:
+    def __init__(self):
+        self.signed = []
+        self.objects = {}
+        self.list_calls = 0
+
+    def blob(self, name):
+        return _FakeBlob(self, name)
+
+    def list_blobs(self, prefix, fields=None):
+        self.list_calls += 1
+        for name in sorted(self.objects):
+            if name.startswith(prefix):
+                yield _FakeBlob(self, name)
+
+
+class _FakeClient:
+    def __init__(self, bucket):
+        self._bucket = bucket
+
+    def bucket(self, name):
+        return self._bucket
+
+    @contextlib.contextmanager
+    def batch(self):
+        yield
+
+
+@pytest.fixture
+def bucket():
+    return _FakeBucket()
+
+
+@pytest.fixture
+def service(bucket, monkeypatch):
+    monkeypatch.setattr(gcs, "_get_client", lambda: _FakeClient(bucket))
+    return gcs.GCSStorageService("test-bucket")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A monotonic clock the test moves forward by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(gcs.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_signed_url_reused_while_valid_for_the_requested_time(service, bucket, clock):
+    url = service.get_signed_url("a/report.html", expiration_hours=1)
+    assert service.get_signed_url("a/report.html", expiration_hours=1) == url
+    # Within the margin the URL still counts as valid for an hour
+    clock[0] += gcs._SIGNED_URL_REUSE_MARGIN_SECONDS
+    assert service.get_signed_url("a/report.html", expiration_hours=1) == url
+    assert len(bucket.signed) == 1
+    # Past it, a fresh URL is signed rather than one expiring early
+    clock[0] += 1
+    assert service.get_signed_url("a/report.html", expiration_hours=1) != url
+    assert len(bucket.signed) == 2
+
+
+def test_signed_url_expiry_is_checked_against_the_requested_validity(service, bucket, clock):
+    week = service.get_signed_url("a/report.html", expiration_hours=168)
+    # A week-long URL signed a minute ago covers a one-hour request
+    clock[0] += 60
+    assert service.get_signed_url("a/report.html", expiration_hours=1) == week
+    assert bucket.signed == [("a/report.html", 168 * 3600)]
+
+    # An hour-long URL does not cover a week-long request
+    hour = service.get_signed_url("b/report.html", expiration_hours=1)
+    assert service.get_signed_url("b/report.html", expiration_hours=168) not in (hour, week)
+    assert bucket.signed[1:] == [("b/report.html", 3600), ("b/report.html", 168 * 3600)]
+
+
+def test_listing_cached_until_a_write_under_the_prefix(service, bucket):
+    bucket.objects = {"v1/a.json": b"", "v1/b.json": b"", "v2/a.json": b""}
+    assert service.list_files("v1/") == ["v1/a.json", "v1/b.json"]
+    assert service.list_files("v1/") == ["v1/a.json", "v1/b.json"]
+    assert bucket.list_calls == 1
+
+    # Writes elsewhere leave the listing cached
+    service.upload_bytes("v2/b.json", b"{}")
+    assert service.list_files("v1/") == ["v1/a.json", "v1/b.json"]
+    assert bucket.list_calls == 1
+
+    service.upload_bytes("v1/c.json", b"{}")
+    assert service.list_files("v1/") == ["v1/a.json", "v1/b.json", "v1/c.json"]
+    service.delete_file("v1/a.json")
+    assert service.list_files("v1/") == ["v1/b.json", "v1/c.json"]
+    service.delete_files(["v1/b.json", "v1/c.json"])
+    assert service.list_files("v1/") == []
+    assert bucket.list_calls == 4
+
+
+def test_deleting_a_prefix_drops_listings_nested_under_it(service, bucket):
+    bucket.objects = {"vid/run1/a.json": b"", "vid/run2/a.json": b""}
+    assert service.list_files("vid/run1/") == ["vid/run1/a.json"]
+    service._invalidate_listings(["vid/"])
+    bucket.objects.pop("vid/run1/a.json")
+    assert service.list_files("vid/run1/") == []
+
+
+def test_listing_not_cached_if_incomplete_or_overlapping_a_write(service, bucket):
+    bucket.objects = {"v1/a.json": b"", "v1/b.json": b""}
+    # A listing the caller stopped reading is not cached
+    assert next(service.iter_files("v1/")) == "v1/a.json"
+    assert service.list_files("v1/") == ["v1/a.json", "v1/b.json"]
+    assert bucket.list_calls == 2
+
+    # Nor is one that a write overlapped, as it may have missed the new object
+    service._invalidate_listings(["v1/"])
+    names = service.iter_files("v1/")
+    assert next(names) == "v1/a.json"
+    service.upload_bytes("v1/0.json", b"{}")
+    assert list(names) == ["v1/b.json"]
+    assert service.list_files("v1/") == ["v1/0.json", "v1/a.json", "v1/b.json"]
+    assert bucket.list_calls == 4
+
+
+@pytest.fixture
+def reports(tmp_path, monkeypatch):
+    """A UnifiedStorageService on local storage, with an empty report_exists cache."""
+    monkeypatch.setattr(unified_storage, "_report_exists_cache", {})
+    service = unified_storage.UnifiedStorageService()
+    service.storage = unified_storage.LocalStorageService(str(tmp_path))
+    return service
+
+
+def test_report_exists_hits_cached_until_forgotten(reports, tmp_path):
+    reports.save_report_files("vid", {"report.json": "{}", "report.html": "<html>"})
+    assert reports.report_exists("vid", "report.json")
+    # Deleted behind the cache's back, as the timestamped cleanup does
+    (tmp_path / "vid" / "report.json").unlink()
+    assert reports.report_exists("vid", "report.json")
+    reports.forget_cached_reports("vid")
+    assert not reports.report_exists("vid", "report.json")
+    assert reports.report_exists("vid", "report.html")
+
+
+def test_report_exists_misses_are_not_cached(reports):
+    assert not reports.report_exists("vid", "report.json")
+    reports.storage.save_file("{}", "vid/report.json")
+    assert reports.report_exists("vid", "report.json")
+
+
+def test_deletes_and_saves_evict_cached_reports(reports):
+    reports.save_report_files("vid", {"report.json": "{}"})
+    assert reports.report_exists("vid", "report.json")
+    reports.storage.delete_file("vid/report.json")
+    assert not reports.report_exists("vid", "report.json")
+
+    unified_storage._report_exists_cache["vid/report.json"] = True
+    reports.save_report_files("vid", {"report.json": "{}"})
+    assert "vid/report.json" not in unified_storage._report_exists_cache
@@ -0,0 +1,93 @@
+"""
+Unit tests for the WorkflowLogger summary, which is aggregated as events arrive.
+
+The baseline rebuilt the summary by walking every stored log entry; a copy of that
+walk is the reference here.
+
+Run with: python -m pytest test/unit/test_workflow_logger_summary.py
+"""
+
+import uuid
+
+from verityngn.services.storage import workflow_logger as wl
+
+
+def _baseline_summary(video_id, entries):
+    """The baseline _create_workflow_summary, walking the full list of entries."""
+    summary = {
+        "video_id": video_id,
+        "start_time": entries[0].timestamp if entries else None,
+        "end_time": entries[-1].timestamp if entries else None,
+        "total_events": len(entries),
+        "steps": {},
+        "llm_calls": [],
+        "errors": [],
+        "token_usage_total": {"input_tokens": 0, "output_tokens": 0}
+    }
+    for entry in entries:
+        if entry.step_type == "state_transition":
+            step = summary["steps"].setdefault(entry.step_name, {"status": "unknown", "duration_ms": 0})
+            if entry.status in ["completed", "failed"]:
+                step["status"] = entry.status
+                if entry.duration_ms:
+                    step["duration_ms"] = entry.duration_ms
+        elif entry.step_type == "llm_call":
+            summary["llm_calls"].append({
+                "step_name": entry.step_name,
+                "model_name": entry.model_name,
+                "duration_ms": entry.duration_ms,
+                "status": entry.status,
+                "token_usage": entry.token_usage
+            })
+            if entry.token_usage:
+                summary["token_usage_total"]["input_tokens"] += entry.token_usage.get("input_tokens", 0)
+                summary["token_usage_total"]["output_tokens"] += entry.token_usage.get("output_tokens", 0)
+        elif entry.step_type == "error":
+            summary["errors"].append({
+                "step_name": entry.step_name,
+                "error_message": entry.error_message,
+                "timestamp": entry.timestamp
+            })
+    return summary
+
+
+class _RecordingLogger(wl.WorkflowLogger):
+    """Keeps every entry, whatever the in-memory bound, so the baseline can be replayed."""
+
+    def __init__(self, video_id):
+        self.all_entries = []
+        super().__init__(video_id, enable_gcs=False)
+
+    def _record_in_summary(self, entry):
+        self.all_entries.append(entry)
+        super()._record_in_summary(entry)
+
+
+def _run_workflow(logger):
+    logger.start_step("download")
+    logger.log_llm_call("extract", "model-a", {"prompt": "x" * 2000}, {"claims": []}, 120,
+                        {"input_tokens": 10, "output_tokens": 5})
+    logger.log_info("progress", "halfway")
+    logger.log_error("verify", "timeout", {"claim": 1})
+    logger.complete_step("download", {"ok": True})
+    logger.start_step("report")
+    logger.log_llm_call("summarize", "model-b", {"prompt": "y"}, None, None, None, error="quota")
+    logger.log_llm_call("summarize", "model-b", {"prompt": "y"}, {"text": "z"}, 80, {"input_tokens": 7})
+    logger._log_event("report", "state_transition", duration_ms=15, status="failed")
+
+
+def test_summary_matches_baseline():
+    logger = _RecordingLogger(f"test_{uuid.uuid4().hex}")
+    _run_workflow(logger)
+    assert list(logger.log_entries) == logger.all_entries
+    assert logger._create_workflow_summary() == _baseline_summary(logger.video_id, logger.all_entries)
+
+
+def test_summary_covers_entries_dropped_from_memory(monkeypatch):
+    monkeypatch.setattr(wl, "_LOG_ENTRIES_MAXLEN", 3)
+    logger = _RecordingLogger(f"test_{uuid.uuid4().hex}")
+    _run_workflow(logger)
+    for i in range(20):
+        logger.log_info("loop", str(i))
+    assert len(logger.log_entries) == 3
+    assert logger._create_workflow_summary() == _baseline_summary(logger.video_id, logger.all_entries)
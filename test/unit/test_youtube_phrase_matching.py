@@ -0,0 +1,260 @@
+"""
+Unit tests for the single-scan phrase matching in the YouTube search service.
+
+The classifiers used to call ``in`` / ``str.count`` once per phrase. Each test here
+keeps a copy of that baseline logic and checks the matcher-based version gives
+the same answers on a representative corpus.
+
+Run with: python -m pytest test/unit/test_youtube_phrase_matching.py
+"""
+
+import random
+import re
+
+from verityngn.services.search import youtube_search as yt
+
+
+SERVICE = yt.youtube_search_service
+
+TRANSCRIPTS = [
+    "",
+    "This product is a scam. The reviews are fake and the results are fabricated.",
+    "Honestly it works. I would recommend it, the results were good and it helps with energy.",
+    "It's not worth it. Total waste of money, no results after a month. Beware of these tactics.",
+    "Is it worth it? Doctors say the study was peer reviewed, but the FDA issued a consumer alert.",
+    "Scam scam scam! SCAMMERS everywhere... fake fake. It doesn't work, it doesn't work at all.",
+    "The clinical trial evidence is weak. An expert investigation exposed deceptive, predatory marketing.",
+    "good good good good. positive and beneficial. success! legit. effective. works works.",
+    "lie lies liar believe relief. falsely false. warnings warning. avoided avoid.",
+    "Short. Very short sentence here with misleading words. overhyped and overpriced, disappointing, useless",
+]
+
+FILLER = ("the", "product", "video", "review", "preview", "honest", "my", "a", "it", ".", "!", "reviewer",
+          "official website", "results.", "this", "and", "not", "really")
+
+
+def _random_texts(vocabulary, count=300, seed=1234, min_words=0, max_words=60):
+    """Random, reproducible texts mixing phrases from the vocabulary with filler words."""
+    rng = random.Random(seed)
+    words = sorted(set(vocabulary)) + list(FILLER)
+    texts = []
+    for _ in range(count):
+        picked = [rng.choice(words) for _ in range(rng.randint(min_words, max_words))]
+        text = " ".join(picked)
+        if rng.random() < 0.3:
+            text = text.upper()
+        elif rng.random() < 0.5:
+            text = text.title()
+        texts.append(text)
+    return texts
+
+
+TRANSCRIPT_VOCABULARY = yt._CI_COUNTER_PHRASES + yt._CI_SUPPORTING_PHRASES + yt._CI_CREDIBILITY_TERMS
+CORPUS = TRANSCRIPTS + _random_texts(TRANSCRIPT_VOCABULARY)
+
+
+def _baseline_transcript_analysis(transcript):
+    """The per-phrase str.count / str.find implementation the matcher replaced."""
+    transcript_lower = transcript.lower()
+    counter_phrases = list(yt._CI_COUNTER_PHRASES)
+    supporting_phrases = list(yt._CI_SUPPORTING_PHRASES)
+    result = {
+        'counter_signals': sum(transcript_lower.count(phrase) for phrase in counter_phrases),
+        'supporting_signals': sum(transcript_lower.count(phrase) for phrase in supporting_phrases),
+        'stance': 'neutral',
+        'confidence': 0.5,
+        'key_critical_phrases_found': [],
+        'key_phrases': [],
+    }
+    total_signals = result['counter_signals'] + result['supporting_signals']
+    if total_signals > 0:
+        counter_ratio = result['counter_signals'] / total_signals
+        if counter_ratio > 0.7:
+            result['stance'] = 'counter'
+            result['confidence'] = min(0.95, 0.6 + (counter_ratio - 0.7) * 1.17)
+        elif counter_ratio < 0.3:
+            result['stance'] = 'supporting'
+            result['confidence'] = min(0.95, 0.6 + (0.3 - counter_ratio) * 1.17)
+    for phrase in counter_phrases:
+        if phrase in transcript_lower:
+            for sentence in transcript.split('.'):
+                if phrase in sentence.lower() and len(sentence.strip()) > 10:
+                    clean_sentence = sentence.strip()
+                    if len(clean_sentence) > 80:
+                        clean_sentence = clean_sentence[:80] + "..."
+                    result['key_critical_phrases_found'].append(f'"{phrase}": {clean_sentence}')
+                    break
+    for phrase in counter_phrases + supporting_phrases:
+        if phrase in transcript_lower:
+            index = transcript_lower.find(phrase)
+            start = max(0, index - 50)
+            end = min(len(transcript), index + len(phrase) + 50)
+            result['key_phrases'].append({'phrase': phrase, 'context': transcript[start:end].strip()})
+    result['credibility_signals'] = [term for term in yt._CI_CREDIBILITY_TERMS if term in transcript_lower]
+    return result
+
+
+def test_phrase_matcher_reports_overlapping_occurrences():
+    matcher = yt._PhraseMatcher(["aa", "not worth it", "worth it"])
+    # Unlike str.count, every start position is reported, including self-overlaps
+    assert list(matcher.finditer("aaa")) == [(0, "aa"), (1, "aa")]
+    assert "aaa".count("aa") == 1
+    assert list(matcher.finditer("not worth it")) == [(0, "not worth it"), (4, "worth it")]
+    assert matcher.search("is it worth it?")
+    assert not matcher.search("worthless")
+
+
+def test_phrase_matcher_finds_same_positions_as_str_find():
+    matcher = yt._PhraseMatcher(TRANSCRIPT_VOCABULARY + FILLER)
+    for text in CORPUS:
+        text = text.lower()
+        expected = sorted(
+            (index, phrase)
+            for phrase in matcher.phrases
+            for index in range(len(text))
+            if text.startswith(phrase, index)
+        )
+        assert sorted(matcher.finditer(text)) == expected
+
+
+def test_transcript_analysis_matches_baseline():
+    for transcript in CORPUS:
+        expected = _baseline_transcript_analysis(transcript)
+        actual = SERVICE._analyze_counter_intelligence_transcript(transcript, "title", "main")
+        for key, value in expected.items():
+            assert actual[key] == value, (key, transcript)
+
+
+def test_transcript_counts_skip_self_overlaps_like_str_count(monkeypatch):
+    # None of the shipped phrases can overlap itself, so use one that does
+    counter_phrases = yt._CI_COUNTER_PHRASES + ("haha",)
+    monkeypatch.setattr(yt, "_CI_COUNTER_PHRASES", counter_phrases)
+    monkeypatch.setattr(yt, "_CI_TRANSCRIPT_MATCHER", yt._PhraseMatcher(
+        counter_phrases + yt._CI_SUPPORTING_PHRASES + yt._CI_CREDIBILITY_TERMS))
+    transcript = "hahaha, what a scam. hahahaha"
+    expected = _baseline_transcript_analysis(transcript)
+    actual = SERVICE._analyze_counter_intelligence_transcript(transcript, "title", "main")
+    assert actual['counter_signals'] == expected['counter_signals'] == 4
+
+
+def _baseline_counter_intelligence_score(video):
+    """The per-keyword ``in`` checks the single-scan score replaced."""
+    score = 0.0
+    title = video.get('title', '').lower()
+    description = video.get('description', '').lower()
+    for keyword in yt._CI_SCORE_KEYWORDS:
+        if keyword in title:
+            score += 2.0
+        if keyword in description:
+            score += 1.0
+    view_count = video.get('view_count', 0)
+    if view_count > 100000:
+        score += 1.0
+    elif view_count > 10000:
+        score += 0.5
+    return score
+
+
+def test_counter_intelligence_score_matches_baseline():
+    titles = _random_texts(yt._CI_SCORE_KEYWORDS, seed=11, max_words=12)
+    descriptions = _random_texts(yt._CI_SCORE_KEYWORDS, seed=12)
+    for i, (title, description) in enumerate(zip(titles, descriptions)):
+        video = {'title': title, 'description': description, 'view_count': (0, 20000, 200000)[i % 3]}
+        assert SERVICE.calculate_counter_intelligence_score(video) == _baseline_counter_intelligence_score(video), video
+    # A keyword split across the title/description boundary counts for neither
+    video = {'title': 'this is a supplement', 'description': 'scam or not'}
+    assert SERVICE.calculate_counter_intelligence_score(video) == _baseline_counter_intelligence_score(video) == 1.0
+
+
+def _baseline_has_review(title):
+    # The baseline used a substring test; 'review' is now matched as a whole word
+    # (see test_review_title_is_a_whole_word), so compare against that
+    return re.search(r'\breviews?\b', title) is not None
+
+
+def _baseline_has_strong_negative(text_lower):
+    return any(term in text_lower for term in yt._STRONG_NEGATIVE_TERMS)
+
+
+def _baseline_is_promotional_shill(video):
+    """The per-term ``in`` checks the matcher-based shill heuristics replaced."""
+    title = (video.get('title') or '').lower()
+    desc = (video.get('description') or '').lower()
+    if _baseline_has_strong_negative(f"{title} {desc}"):
+        return False
+    if _baseline_has_review(title) and any(term in desc for term in yt._PROMO_TERMS):
+        return True
+    if any(term in title for term in yt._PROMO_TERMS):
+        return True
+    if (any(p in desc for p in yt._CTA_PATTERNS) and _baseline_has_review(title)
+            and not _baseline_has_strong_negative(title)):
+        return True
+    if 'official website' in title or 'official website' in desc:
+        return True
+    return False
+
+
+SHILL_VOCABULARY = yt._STRONG_NEGATIVE_TERMS + yt._PROMO_TERMS + yt._CTA_PATTERNS
+
+
+def test_strong_negative_matches_baseline():
+    for text in _random_texts(SHILL_VOCABULARY, seed=21, max_words=8):
+        text = text.lower()
+        assert bool(SERVICE._has_strong_negative(text)) == _baseline_has_strong_negative(text), text
+
+
+def test_promotional_shill_matches_baseline():
+    titles = _random_texts(SHILL_VOCABULARY, seed=22, max_words=6)
+    descriptions = _random_texts(SHILL_VOCABULARY, seed=23, max_words=10)
+    videos = [{'title': t, 'description': d} for t, d in zip(titles, descriptions)]
+    videos += [
+        {'title': 'Product Review', 'description': 'Use code SAVE10 for a discount'},
+        {'title': 'Product Review', 'description': 'Like and subscribe!'},
+        {'title': 'Product Review - SCAM?', 'description': 'Like and subscribe!'},
+        {'title': 'My honest thoughts', 'description': 'Visit the official website'},
+        {'title': None, 'description': None},
+    ]
+    for video in videos:
+        assert SERVICE._is_promotional_shill(video) == _baseline_is_promotional_shill(video), video
+
+
+def _baseline_video_stance(title, description):
+    """The per-indicator ``in`` checks the single-scan stance scoring replaced."""
+    title_lower = title.lower()
+    desc_lower = description.lower()
+    counter_indicators = yt._COUNTER_INDICATORS
+    confirming_indicators = yt._CONFIRMING_INDICATORS
+    counter_score = sum(1 for i in counter_indicators if i in title_lower or i in desc_lower)
+    confirming_score = sum(1 for i in confirming_indicators if i in title_lower or i in desc_lower)
+    key_points = []
+    if counter_score > confirming_score and counter_score > 0:
+        stance, confidence, indicators = 'counter', min(counter_score / 3.0, 1.0), counter_indicators
+    elif confirming_score > counter_score and confirming_score > 0:
+        stance, confidence, indicators = 'confirming', min(confirming_score / 3.0, 1.0), confirming_indicators
+    else:
+        return {'stance': 'neutral', 'confidence': 0.1, 'key_points': ['No clear stance detected']}
+    for indicator in indicators:
+        if indicator in title_lower:
+            key_points.append(f"Title mentions '{indicator}'")
+        if indicator in desc_lower:
+            key_points.append(f"Description mentions '{indicator}'")
+    return {'stance': stance, 'confidence': confidence, 'key_points': key_points[:3]}
+
+
+def test_video_stance_matches_baseline():
+    vocabulary = yt._COUNTER_INDICATORS + yt._CONFIRMING_INDICATORS
+    titles = _random_texts(vocabulary, seed=31, max_words=8)
+    descriptions = _random_texts(vocabulary, seed=32, max_words=20)
+    for title, description in zip(titles, descriptions):
+        expected = _baseline_video_stance(title, description)
+        assert SERVICE.analyze_video_stance(title, description, "target") == expected, (title, description)
+
+
+def test_review_title_is_a_whole_word():
+    promo_description = 'Use code SAVE10 for a discount'
+    assert SERVICE._is_promotional_shill({'title': 'Honest Review', 'description': promo_description})
+    assert SERVICE._is_promotional_shill({'title': 'Two reviews', 'description': promo_description})
+    # Intended difference from the baseline substring test: these are not review titles
+    for title in ('Trailer preview', 'Reviewer roundup'):
+        assert 'review' in title.lower()
+        assert not SERVICE._is_promotional_shill({'title': title, 'description': promo_description})
@@ -44,6 +44,11 @@ GCS_BUCKET_NAME = os.getenv("GCS_BUCKET_NAME") or _config.get("gcp.bucket_name",
 # Optional GCS bucket for local container outputs (for development/testing)
 GCS_LOCAL_OUTPUTS_BUCKET = os.getenv("GCS_LOCAL_OUTPUTS_BUCKET", "vngn_local_outputs")
 ENABLE_LOCAL_GCS_BACKUP = os.getenv("ENABLE_LOCAL_GCS_BACKUP", "false").lower() in ("true", "1", "t")
+# Concurrent file uploads used by GCSStorageService.upload_directory
+try:
+    GCS_UPLOAD_WORKERS = max(1, int(os.getenv("GCS_UPLOAD_WORKERS", "16")))
+except Exception:
+    GCS_UPLOAD_WORKERS = 16
 
 # AI Model settings  
 VERTEX_MODEL_NAME = _config.get("models.vertex.model_name", "gemini-2.5-flash")
@@ -99,6 +104,21 @@ YOUTUBE_DISABLE_V3 = os.getenv("YOUTUBE_DISABLE_V3", "true").lower() in ("true",
 YOUTUBE_API_FALLBACK = os.getenv("YOUTUBE_API_FALLBACK", "true").lower() in ("true", "1", "t")
 YOUTUBE_API_ENABLED = os.getenv("YOUTUBE_API_ENABLED", "true").lower() in ("true", "1", "t")
 
+# Invidious HTTP search fallback (tried before yt-dlp when the Data API is unavailable).
+# Off by default: it sends search queries to third-party instances, and none are
+# configured out of the box.
+# Comma-separated list of Invidious-compatible instances exposing /api/v1/search
+INVIDIOUS_FALLBACK_ENABLED = os.getenv("INVIDIOUS_FALLBACK_ENABLED", "false").lower() in ("true", "1", "t")
+INVIDIOUS_INSTANCES: List[str] = [
+    u.strip().rstrip("/")
+    for u in os.getenv("INVIDIOUS_INSTANCES", "").split(",")
+    if u.strip()
+]
+try:
+    INVIDIOUS_TIMEOUT_SECONDS = float(os.getenv("INVIDIOUS_TIMEOUT_SECONDS", "5"))
+except Exception:
+    INVIDIOUS_TIMEOUT_SECONDS = 5.0
+
 # Counter-intelligence enhancement (downloading .info.json / .vtt for found videos)
 # Disabled by default to avoid heavy I/O during search
 CI_ENHANCEMENT_ENABLED = os.getenv("CI_ENHANCEMENT_ENABLED", "False").lower() in ("true", "1", "t")
@@ -1,9 +1,80 @@
 import os
 import logging
 import glob
-from typing import List, Optional, Tuple
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
 from datetime import timedelta
+from cachetools import TTLCache
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from requests.adapters import HTTPAdapter
+
+from verityngn.config.settings import GCS_UPLOAD_WORKERS
+
+# Files above this size are uploaded as concurrent multipart chunks
+_CHUNKED_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+_CHUNKED_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+_CHUNKED_UPLOAD_WORKERS = 8
+
+# Blobs above this size are downloaded as concurrent ranged reads
+_CHUNKED_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+_CHUNKED_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+_CHUNKED_DOWNLOAD_WORKERS = 8
+
+# Deletes are sent as multipart batch requests of at most this many objects
+_DELETE_BATCH_SIZE = 100
+
+# Signed URLs are kept for up to an hour, and reused only while they stay valid for
+# as long as the caller asked, less this margin
+_SIGNED_URL_CACHE_TTL_SECONDS = 3600
+_SIGNED_URL_REUSE_MARGIN_SECONDS = 300
+
+# Listings are reused briefly so back-to-back lookups of the same prefix share one LIST call
+_LIST_CACHE_TTL_SECONDS = 5
+
+# HTTP connections kept per host, enough for the largest concurrent transfer pool
+_HTTP_POOL_SIZE = max(GCS_UPLOAD_WORKERS, _CHUNKED_UPLOAD_WORKERS, _CHUNKED_DOWNLOAD_WORKERS)
+
+# Shared client: credential loading and the HTTP session are set up once per process
+_client: Optional[storage.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> storage.Client:
+    """Return the client shared by all GCSStorageService instances, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            client = storage.Client()
+            # requests keeps 10 connections per host by default, fewer than the transfer workers
+            adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+            client._http.mount("https://", adapter)
+            _client = client
+        return _client
+
+
+def _iter_files(root: str):
+    """
+    Yield paths of all non-directory entries under root, like os.walk without followlinks.
+    
+    Uses os.scandir so entry types come from the directory listing instead of a stat per entry.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Symlinked directories are not descended into, matching os.walk
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    yield entry.path
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
 
 class GCSStorageService:
     """Service for interacting with Google Cloud Storage."""
@@ -17,10 +88,16 @@ class GCSStorageService:
         """
         self.bucket_name = bucket_name
         self.logger = logging.getLogger(__name__)
+        self._signed_url_cache = TTLCache(maxsize=4096, ttl=_SIGNED_URL_CACHE_TTL_SECONDS)
+        self._signed_url_lock = threading.Lock()
+        self._list_cache = TTLCache(maxsize=256, ttl=_LIST_CACHE_TTL_SECONDS)
+        self._list_cache_lock = threading.Lock()
+        # Bumped on every write so listings that overlap a write are not cached
+        self._list_cache_generation = 0
         
         # Initialize client and bucket
         try:
-            self.client = storage.Client()
+            self.client = _get_client()
             # Use bucket() method instead of get_bucket() to avoid validation
             # The bucket will be validated on first upload attempt
             self.bucket = self.client.bucket(bucket_name)
@@ -51,18 +128,25 @@ class GCSStorageService:
         
         try:
             blob = self.bucket.blob(gcs_path)
-            blob.upload_from_filename(local_file_path)
+            if os.path.getsize(local_file_path) > _CHUNKED_UPLOAD_THRESHOLD:
+                # Large artifacts (e.g. videos): upload parts in parallel via XML multipart upload
+                transfer_manager.upload_chunks_concurrently(
+                    local_file_path,
+                    blob,
+                    chunk_size=_CHUNKED_UPLOAD_CHUNK_SIZE,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=_CHUNKED_UPLOAD_WORKERS,
+                )
+            else:
+                blob.upload_from_filename(local_file_path)
+            self._invalidate_listings([gcs_path])
             
             self.logger.info(f"✅ Uploaded {local_file_path} to gs://{self.bucket_name}/{gcs_path}")
             
             # Try to generate signed URL, but don't fail if we can't
             signed_url = None
             try:
-                signed_url = blob.generate_signed_url(
-                    version="v4",
-                    expiration=timedelta(days=7),
-                    method="GET"
-                )
+                signed_url = self._generate_signed_url(gcs_path, 7 * 24)
                 self.logger.info(f"Generated signed URL: {signed_url}")
             except Exception as url_error:
                 self.logger.warning(f"Could not generate signed URL (upload succeeded): {url_error}")
@@ -74,6 +158,31 @@ class GCSStorageService:
             self.logger.error(f"❌ Error uploading file to GCS: {e}")
             return False, None
     
+    def upload_bytes(self, gcs_path: str, data: bytes, content_type: str = "application/octet-stream") -> bool:
+        """
+        Upload an in-memory payload to GCS without staging it in a local file.
+        
+        Args:
+            gcs_path (str): Path in GCS to upload the data to
+            data (bytes): Payload to upload
+            content_type (str): Content type stored on the object
+            
+        Returns:
+            bool: True if upload was successful, False otherwise
+        """
+        if not self.bucket:
+            self.logger.error("Bucket not initialized")
+            return False
+        
+        try:
+            self.bucket.blob(gcs_path).upload_from_string(data, content_type=content_type)
+            self._invalidate_listings([gcs_path])
+            self.logger.info(f"✅ Uploaded {len(data)} bytes to gs://{self.bucket_name}/{gcs_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ Error uploading data to GCS: {e}")
+            return False
+    
     def get_signed_url(self, gcs_path: str, expiration_hours: int = 168) -> str:
         """
         Generate a signed URL for a GCS object.
@@ -90,18 +199,37 @@ class GCSStorageService:
             return f"gs://{self.bucket_name}/{gcs_path}"
         
         try:
-            blob = self.bucket.blob(gcs_path)
-            signed_url = blob.generate_signed_url(
-                version="v4",
-                expiration=timedelta(hours=expiration_hours),
-                method="GET"
-            )
-            return signed_url
+            return self._generate_signed_url(gcs_path, expiration_hours)
         except Exception as e:
             self.logger.warning(f"Could not generate signed URL for {gcs_path}: {e}")
             # Return GCS path as fallback
             return f"gs://{self.bucket_name}/{gcs_path}"
     
+    def _generate_signed_url(self, gcs_path: str, expiration_hours: int) -> str:
+        """
+        Generate a V4 signed GET URL, reusing a recent one for the same object if it
+        is still valid for the requested time, less a small margin.
+        
+        Raises whatever the signer raises; callers decide on the fallback.
+        """
+        validity = expiration_hours * 3600
+        with self._signed_url_lock:
+            cached = self._signed_url_cache.get(gcs_path)
+        if cached is not None:
+            signed_url, expires_at = cached
+            if expires_at - time.monotonic() >= validity - _SIGNED_URL_REUSE_MARGIN_SECONDS:
+                return signed_url
+        
+        expires_at = time.monotonic() + validity
+        signed_url = self.bucket.blob(gcs_path).generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=validity),
+            method="GET"
+        )
+        with self._signed_url_lock:
+            self._signed_url_cache[gcs_path] = (signed_url, expires_at)
+        return signed_url
+    
     def upload_directory(self, local_dir_path: str, gcs_base_path: str, include_pattern: Optional[str] = None) -> List[str]:
         """
         Upload a directory to GCS.
@@ -129,18 +257,31 @@ class GCSStorageService:
             if include_pattern:
                 files = glob.glob(os.path.join(local_dir_path, include_pattern))
             else:
-                files = []
-                for root, _, filenames in os.walk(local_dir_path):
-                    for filename in filenames:
-                        files.append(os.path.join(root, filename))
+                files = list(_iter_files(local_dir_path))
             
-            # Upload each file
+            # Pair each file with its GCS destination
+            uploads = []
+            dir_prefix = os.path.join(local_dir_path, "")
             for file_path in files:
-                # Calculate relative path
-                rel_path = os.path.relpath(file_path, local_dir_path)
+                # Calculate relative path (plain slicing for paths under the directory)
+                if file_path.startswith(dir_prefix):
+                    rel_path = file_path[len(dir_prefix):]
+                else:
+                    rel_path = os.path.relpath(file_path, local_dir_path)
                 gcs_path = os.path.join(gcs_base_path, rel_path).replace("\\", "/")
-                
-                if self.upload_file(file_path, gcs_path):
+                uploads.append((file_path, gcs_path))
+            
+            # Let the transfer manager upload the batch concurrently on worker threads
+            results = transfer_manager.upload_many(
+                [(file_path, self.bucket.blob(gcs_path)) for file_path, gcs_path in uploads],
+                worker_type=transfer_manager.THREAD,
+                max_workers=GCS_UPLOAD_WORKERS,
+            )
+            self._invalidate_listings([gcs_path for _, gcs_path in uploads])
+            for (file_path, gcs_path), result in zip(uploads, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"❌ Error uploading {file_path} to GCS: {result}")
+                else:
                     uploaded_files.append(gcs_path)
             
             self.logger.info(f"Uploaded {len(uploaded_files)} files to gs://{self.bucket_name}/{gcs_base_path}")
@@ -150,13 +291,15 @@ class GCSStorageService:
             self.logger.error(f"Error uploading directory to GCS: {e}")
             return uploaded_files
     
-    def download_file(self, gcs_path: str, local_file_path: str) -> bool:
+    def download_file(self, gcs_path: str, local_file_path: str, size: Optional[int] = None) -> bool:
         """
         Download a file from GCS.
         
         Args:
             gcs_path (str): Path in GCS to download the file from
             local_file_path (str): Path to save the local file
+            size (Optional[int]): Object size in bytes if already known, e.g. from a
+                listing; large objects are then fetched in parallel range requests
             
         Returns:
             bool: True if download was successful, False otherwise
@@ -170,13 +313,113 @@ class GCSStorageService:
             os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
             
             blob = self.bucket.blob(gcs_path)
-            blob.download_to_filename(local_file_path)
+            # Without a known size a single streaming download avoids an extra metadata request
+            if size is not None and size > _CHUNKED_DOWNLOAD_THRESHOLD:
+                transfer_manager.download_chunks_concurrently(
+                    blob,
+                    local_file_path,
+                    chunk_size=_CHUNKED_DOWNLOAD_CHUNK_SIZE,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=_CHUNKED_DOWNLOAD_WORKERS,
+                )
+            else:
+                blob.download_to_filename(local_file_path)
             self.logger.info(f"Downloaded gs://{self.bucket_name}/{gcs_path} to {local_file_path}")
             return True
         except Exception as e:
             self.logger.error(f"Error downloading file from GCS: {e}")
             return False
     
+    def download_bytes(self, gcs_path: str) -> Optional[bytes]:
+        """
+        Download a GCS object into memory.
+        
+        Args:
+            gcs_path (str): Path in GCS to download
+            
+        Returns:
+            Optional[bytes]: Object contents, or None if the download failed
+        """
+        if not self.bucket:
+            self.logger.error("Bucket not initialized")
+            return None
+        
+        try:
+            return self.bucket.blob(gcs_path).download_as_bytes()
+        except Exception as e:
+            self.logger.error(f"Error downloading gs://{self.bucket_name}/{gcs_path} from GCS: {e}")
+            return None
+    
+    def file_exists(self, gcs_path: str) -> bool:
+        """
+        Check whether an object exists in GCS.
+        
+        Args:
+            gcs_path (str): Path in GCS to check
+            
+        Returns:
+            bool: True if the object exists, False otherwise (including on errors)
+        """
+        if not self.bucket:
+            self.logger.error("Bucket not initialized")
+            return False
+        
+        try:
+            return self.bucket.blob(gcs_path).exists()
+        except Exception as e:
+            self.logger.error(f"Error checking gs://{self.bucket_name}/{gcs_path} in GCS: {e}")
+            return False
+    
+    def delete_file(self, gcs_path: str) -> bool:
+        """
+        Delete an object from GCS.
+        
+        Args:
+            gcs_path (str): Path in GCS to delete
+            
+        Returns:
+            bool: True if the object was deleted, False otherwise
+        """
+        if not self.bucket:
+            self.logger.error("Bucket not initialized")
+            return False
+        
+        try:
+            self.bucket.blob(gcs_path).delete()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error deleting gs://{self.bucket_name}/{gcs_path} from GCS: {e}")
+            return False
+        finally:
+            self._invalidate_listings([gcs_path])
+    
+    def delete_files(self, gcs_paths: List[str]) -> int:
+        """
+        Delete objects from GCS, sending the deletes as batched requests.
+        
+        Args:
+            gcs_paths (List[str]): Paths in GCS to delete
+            
+        Returns:
+            int: Number of objects in batches that completed without error
+        """
+        if not self.bucket:
+            self.logger.error("Bucket not initialized")
+            return 0
+        
+        deleted = 0
+        for start in range(0, len(gcs_paths), _DELETE_BATCH_SIZE):
+            batch_paths = gcs_paths[start:start + _DELETE_BATCH_SIZE]
+            try:
+                with self.client.batch():
+                    for gcs_path in batch_paths:
+                        self.bucket.blob(gcs_path).delete()
+                deleted += len(batch_paths)
+            except Exception as e:
+                self.logger.warning(f"Failed to delete batch of {len(batch_paths)} GCS files starting at {batch_paths[0]}: {e}")
+            self._invalidate_listings(batch_paths)
+        return deleted
+    
     def list_files(self, gcs_path_prefix: str) -> List[str]:
         """
         List files in GCS with the given prefix.
@@ -187,13 +430,84 @@ class GCSStorageService:
         Returns:
             List[str]: List of GCS paths for files with the given prefix
         """
+        return list(self.iter_files(gcs_path_prefix))
+    
+    def iter_files(self, gcs_path_prefix: str) -> Iterator[str]:
+        """
+        Iterate over files in GCS with the given prefix.
+        
+        Names are yielded lazily, page by page, so callers can stop early without
+        listing the whole prefix. Complete listings are cached for a few seconds
+        and dropped when this service writes or deletes under the prefix.
+        
+        Args:
+            gcs_path_prefix (str): Prefix to filter files by
+            
+        Returns:
+            Iterator[str]: GCS paths for files with the given prefix
+        """
         if not self.bucket:
             self.logger.error("Bucket not initialized")
-            return []
+            return iter(())
+        
+        with self._list_cache_lock:
+            cached = self._list_cache.get(gcs_path_prefix)
+            generation = self._list_cache_generation
+        if cached is not None:
+            return iter(cached)
         
+        return self._iter_listed_files(gcs_path_prefix, generation)
+    
+    def _iter_listed_files(self, gcs_path_prefix: str, generation: int) -> Iterator[str]:
+        """Yield names from a fresh listing, caching it if it completes without an overlapping write."""
+        names = []
         try:
-            blobs = self.bucket.list_blobs(prefix=gcs_path_prefix)
-            return [blob.name for blob in blobs]
+            # Only blob names are needed; skip the rest of the object metadata
+            blobs = self.bucket.list_blobs(prefix=gcs_path_prefix, fields="items(name),nextPageToken")
+            for blob in blobs:
+                names.append(blob.name)
+                yield blob.name
         except Exception as e:
             self.logger.error(f"Error listing files in GCS: {e}")
-            return [] 
\ No newline at end of file
+            return
+        
+        with self._list_cache_lock:
+            if generation == self._list_cache_generation:
+                self._list_cache[gcs_path_prefix] = tuple(names)
+    
+    def list_files_filtered(self, gcs_path_prefix: str, match_glob: str) -> Iterator[str]:
+        """
+        List files under a prefix whose full name matches a glob.
+        
+        The glob is applied by GCS, so non-matching objects are never sent back.
+        
+        Args:
+            gcs_path_prefix (str): Prefix to filter files by
+            match_glob (str): Server-side glob on the full object name
+            
+        Returns:
+            Iterator[str]: GCS paths of matching files
+        """
+        if not self.bucket:
+            self.logger.error("Bucket not initialized")
+            return
+        
+        try:
+            blobs = self.bucket.list_blobs(
+                prefix=gcs_path_prefix,
+                match_glob=match_glob,
+                fields="items(name),nextPageToken",
+            )
+            for blob in blobs:
+                yield blob.name
+        except Exception as e:
+            self.logger.error(f"Error listing files in GCS: {e}")
+    
+    def _invalidate_listings(self, gcs_paths: Iterable[str]) -> None:
+        """Drop cached listings that cover, or lie under, any of the written or deleted paths."""
+        with self._list_cache_lock:
+            self._list_cache_generation += 1
+            for gcs_path in gcs_paths:
+                stale = [p for p in self._list_cache.keys() if gcs_path.startswith(p) or p.startswith(gcs_path)]
+                for prefix in stale:
+                    self._list_cache.pop(prefix, None)
@@ -1,11 +1,26 @@
 import logging
 import os
-from typing import Optional
+import threading
+from typing import Iterator, Optional
 from datetime import timedelta
 from google.cloud import storage
 
 from verityngn.config.settings import PROJECT_ID, GCS_BUCKET_NAME
 
+# Shared client: credential loading and the HTTP session are set up once and reused
+_client: Optional[storage.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> storage.Client:
+    """Return the module-wide GCS client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = storage.Client(project=PROJECT_ID)
+        return _client
+
+
 def upload_to_gcs(local_file_path: str, gcs_path: str, bucket_name: Optional[str] = None) -> str:
     """
     Upload a file to Google Cloud Storage and generate a signed URL.
@@ -28,8 +43,8 @@ def upload_to_gcs(local_file_path: str, gcs_path: str, bucket_name: Optional[str
             logger.error(f"File not found: {local_file_path}")
             raise FileNotFoundError(f"File not found: {local_file_path}")
             
-        # Initialize GCS client
-        client = storage.Client(project=PROJECT_ID)
+        # Get the shared GCS client
+        client = _get_client()
         
         # Get the bucket
         bucket = client.bucket(bucket_to_use)
@@ -75,8 +90,8 @@ def download_from_gcs(gcs_path: str, local_file_path: str) -> str:
     logger.info(f"Downloading from GCS: {gcs_path} to {local_file_path}")
     
     try:
-        # Initialize GCS client
-        client = storage.Client(project=PROJECT_ID)
+        # Get the shared GCS client
+        client = _get_client()
         
         # Get the bucket
         bucket = client.bucket(GCS_BUCKET_NAME)
@@ -115,14 +130,14 @@ def list_gcs_files(prefix: Optional[str] = None) -> list:
     logger.info(f"Listing GCS files with prefix: {prefix}")
     
     try:
-        # Initialize GCS client
-        client = storage.Client(project=PROJECT_ID)
+        # Get the shared GCS client
+        client = _get_client()
         
         # Get the bucket
         bucket = client.bucket(GCS_BUCKET_NAME)
         
-        # List blobs
-        blobs = bucket.list_blobs(prefix=prefix)
+        # List blobs, fetching only their names
+        blobs = bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken")
         
         # Get the names
         file_paths = [f"gs://{GCS_BUCKET_NAME}/{blob.name}" for blob in blobs]
@@ -132,4 +147,31 @@ def list_gcs_files(prefix: Optional[str] = None) -> list:
         
     except Exception as e:
         logger.error(f"Error listing GCS files: {e}")
-        return [] 
\ No newline at end of file
+        return []
+
+
+def iter_gcs_files(prefix: Optional[str] = None) -> Iterator[str]:
+    """
+    Iterate over files in a GCS bucket.
+    
+    Paths are yielded lazily, page by page, so callers can stop early.
+    
+    Args:
+        prefix (Optional[str]): Prefix to filter files
+        
+    Returns:
+        Iterator[str]: gs:// file paths
+    """
+    logger = logging.getLogger(__name__)
+    logger.info(f"Iterating GCS files with prefix: {prefix}")
+    
+    try:
+        client = _get_client()
+        bucket = client.bucket(GCS_BUCKET_NAME)
+        
+        # List blobs, fetching only their names
+        for blob in bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken"):
+            yield f"gs://{GCS_BUCKET_NAME}/{blob.name}"
+        
+    except Exception as e:
+        logger.error(f"Error listing GCS files: {e}")
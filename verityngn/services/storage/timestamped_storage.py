@@ -15,19 +15,120 @@ Key Features:
 """
 
 import os
+import errno
 import logging
+import copy
 import json
+import mmap
 import shutil
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster completion marker encoding and parsing
+except ImportError:
+    orjson = None
+
 from verityngn.config.settings import STORAGE_BACKEND, StorageBackend, STORAGE_CONFIG
 from verityngn.services.storage.unified_storage import unified_storage
 from verityngn.services.storage.gcs import GCSStorageService
 
 logger = logging.getLogger(__name__)
 
+# Markers at least this large are parsed straight from a read-only mmap instead of a copied buffer
+_MARKER_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _load_marker_cached(marker_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Load a .complete_marker file, reusing the parse while mtime_ns and size match.
+    
+    Each call gets its own copy, so callers may modify the result freely.
+    """
+    return copy.deepcopy(_parse_marker(marker_path, mtime_ns, size))
+
+
+@lru_cache(maxsize=256)
+def _parse_marker(marker_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a .complete_marker file.
+    
+    mtime_ns and size are part of the cache key, so a rewritten marker is parsed
+    again. The returned dict is shared by the cache and must not be mutated.
+    """
+    if orjson is not None and size >= _MARKER_MMAP_THRESHOLD:
+        try:
+            with open(marker_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                    memoryview(mapped) as view:
+                return orjson.loads(view)
+        except orjson.JSONDecodeError:
+            pass  # Retried below so the stdlib fallback applies
+    
+    with open(marker_path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN values, which only the stdlib parser accepts
+    return json.loads(data)
+
+
+def _dump_marker(completion_data: Dict[str, Any]) -> bytes:
+    """Serialize completion marker data as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(completion_data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. non-string keys or big ints, which only the stdlib encoder accepts
+    return json.dumps(completion_data, indent=2).encode('utf-8')
+
+
+def _version_timestamp(dir_name: str) -> str:
+    """Return the '<date>_<time>' prefix of a version directory name (the name itself if it has no '_')."""
+    parts = dir_name.split('_', 2)
+    if len(parts) < 2:
+        return dir_name
+    return parts[0] + "_" + parts[1]
+
+
+def _write_file_atomic(path: str, data: bytes) -> None:
+    """
+    Write data to path so readers see either the old file or the complete new one.
+    
+    The data is written to a temporary sibling, fsynced and renamed over path; the
+    containing directory is then fsynced (where supported) to persist the rename.
+    """
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    
+    try:
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    except OSError:
+        return  # e.g. directories cannot be opened on Windows
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 class TimestampedStorageService:
     """
     Service for managing timestamped report storage with versioning.
@@ -40,6 +141,8 @@ class TimestampedStorageService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.storage_backend = STORAGE_BACKEND
+        # video_id -> (base_dir, base_dir mtime_ns, '_complete' dir names newest first)
+        self._complete_dirs_cache: Dict[str, Tuple[str, int, List[str]]] = {}
         
         if self.storage_backend == StorageBackend.GCS:
             self.gcs_service = GCSStorageService(STORAGE_CONFIG["gcs"]["bucket_name"])
@@ -72,7 +175,8 @@ class TimestampedStorageService:
             self.logger.info(f"Prepared GCS timestamped directory: {timestamped_dir}")
             return timestamped_dir
     
-    def mark_generation_complete(self, timestamped_dir: str, video_id: str, report_metadata: Dict[str, Any]) -> bool:
+    def mark_generation_complete(self, timestamped_dir: str, video_id: str, report_metadata: Dict[str, Any],
+                                 include_file_manifest: bool = True) -> bool:
         """
         Mark a report generation as complete by creating a completion marker.
         
@@ -80,6 +184,10 @@ class TimestampedStorageService:
             timestamped_dir: Path to the timestamped directory
             video_id: Video identifier
             report_metadata: Metadata about the generated report
+            include_file_manifest: Record the directory listing as "files_generated".
+                Callers that never read the manifest can pass False to skip the
+                directory scan (a LIST call on GCS); list_generated_files() returns
+                the listing on demand.
             
         Returns:
             bool: True if marking was successful
@@ -90,20 +198,26 @@ class TimestampedStorageService:
                 "video_id": video_id,
                 "completion_timestamp": datetime.now().isoformat(),
                 "report_metadata": report_metadata,
-                "files_generated": self._list_files_in_directory(timestamped_dir),
                 "version": "1.0"
             }
+            if include_file_manifest:
+                completion_data["files_generated"] = self._list_files_in_directory(timestamped_dir)
             
-            marker_content = json.dumps(completion_data, indent=2)
+            marker_content = _dump_marker(completion_data)
             
             if self.storage_backend == StorageBackend.LOCAL:
-                marker_path = Path(timestamped_dir) / ".complete_marker"
-                with open(marker_path, 'w') as f:
-                    f.write(marker_content)
+                # The marker must be durable before the directory is renamed to _complete
+                _write_file_atomic(os.path.join(timestamped_dir, ".complete_marker"), marker_content)
                 
-                # Update the directory name to indicate completion
-                complete_dir = str(Path(timestamped_dir).parent / f"{Path(timestamped_dir).name.replace('_processing', '_complete')}")
-                shutil.move(timestamped_dir, complete_dir)
+                # Update the directory name to indicate completion (a single atomic rename)
+                parent_dir, dir_name = os.path.split(timestamped_dir)
+                complete_dir = os.path.join(parent_dir, dir_name.replace('_processing', '_complete'))
+                try:
+                    os.rename(timestamped_dir, complete_dir)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(timestamped_dir, complete_dir)
                 
                 self.logger.info(f"Marked local report complete: {complete_dir}")
                 return True
@@ -112,21 +226,12 @@ class TimestampedStorageService:
                 # For GCS, upload the marker file to the same directory as the reports
                 marker_path = f"{timestamped_dir}/.complete_marker"
                 
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-                    temp_file.write(marker_content)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    success, _ = self.gcs_service.upload_file(temp_file_path, marker_path)
-                    if success:
-                        self.logger.info(f"Marked GCS report complete: {marker_path}")
-                        return True
-                    else:
-                        self.logger.error(f"Failed to upload completion marker to GCS: {marker_path}")
-                        return False
-                finally:
-                    os.unlink(temp_file_path)
+                if self.gcs_service.upload_bytes(marker_path, marker_content, content_type="application/json"):
+                    self.logger.info(f"Marked GCS report complete: {marker_path}")
+                    return True
+                else:
+                    self.logger.error(f"Failed to upload completion marker to GCS: {marker_path}")
+                    return False
                     
         except Exception as e:
             self.logger.error(f"Error marking generation complete: {e}")
@@ -144,46 +249,33 @@ class TimestampedStorageService:
         """
         try:
             if self.storage_backend == StorageBackend.LOCAL:
-                base_dir = Path(STORAGE_CONFIG["local"]["outputs_dir"]) / video_id
-                if not base_dir.exists():
-                    return None
-                
-                complete_dirs = []
-                for item in base_dir.iterdir():
-                    if item.is_dir() and item.name.endswith('_complete'):
-                        marker_path = item / ".complete_marker"
-                        if marker_path.exists():
-                            complete_dirs.append(item)
-                
-                if not complete_dirs:
+                base_dir = os.path.join(STORAGE_CONFIG["local"]["outputs_dir"], video_id)
+                if not os.path.exists(base_dir):
                     return None
                 
-                # Sort by timestamp (newest first)
-                complete_dirs.sort(key=lambda x: x.name, reverse=True)
-                latest_dir = complete_dirs[0]
+                # Probe markers newest first and stop at the first complete one
+                for name in self._complete_dir_names(base_dir, video_id):
+                    dir_path = os.path.join(base_dir, name)
+                    if os.path.exists(os.path.join(dir_path, ".complete_marker")):
+                        self.logger.info(f"Found latest local complete report: {dir_path}")
+                        return dir_path
                 
-                self.logger.info(f"Found latest local complete report: {latest_dir}")
-                return str(latest_dir)
+                return None
                 
             else:
-                # For GCS, list directories and find the latest with completion marker
+                # For GCS, list only the completion markers of the video's versions
                 base_path = STORAGE_CONFIG["gcs"]["base_path"]
                 prefix = f"{base_path}/{video_id}/"
-                files = self.gcs_service.list_files(prefix)
-                
-                complete_dirs = set()
-                for file_path in files:
-                    if "/.complete_marker" in file_path:
-                        dir_path = file_path.replace("/.complete_marker", "")
-                        if "_processing" in dir_path:
-                            complete_dirs.add(dir_path)
+                marker_suffix = "/.complete_marker"
+                markers = self.gcs_service.list_files_filtered(prefix, match_glob=f"{prefix}*{marker_suffix}")
+                complete_dirs = [m[:-len(marker_suffix)] for m in markers]
+                complete_dirs = [d for d in complete_dirs if "_processing" in d]
                 
                 if not complete_dirs:
                     return None
                 
-                # Sort by timestamp (newest first)
-                sorted_dirs = sorted(complete_dirs, reverse=True)
-                latest_dir = sorted_dirs[0]
+                # Directory names start with the timestamp, so the largest is the newest
+                latest_dir = max(complete_dirs)
                 
                 self.logger.info(f"Found latest GCS complete report: {latest_dir}")
                 return latest_dir
@@ -192,6 +284,28 @@ class TimestampedStorageService:
             self.logger.error(f"Error finding latest complete report: {e}")
             return None
     
+    def _complete_dir_names(self, base_dir: str, video_id: str) -> List[str]:
+        """
+        Names of the '_complete' version directories under base_dir, newest first.
+        
+        The sorted listing is reused until base_dir's mtime changes, which happens
+        whenever a version directory is created, renamed or removed.
+        """
+        mtime_ns = os.stat(base_dir).st_mtime_ns
+        cached = self._complete_dirs_cache.get(video_id)
+        if cached is not None and cached[0] == base_dir and cached[1] == mtime_ns:
+            return cached[2]
+        
+        with os.scandir(base_dir) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.endswith('_complete') and entry.is_dir(follow_symlinks=False)
+            ]
+        # Directory names start with the timestamp, so lexical order is chronological
+        names.sort(reverse=True)
+        self._complete_dirs_cache[video_id] = (base_dir, mtime_ns, names)
+        return names
+    
     def get_report_file_from_timestamped_dir(self, timestamped_dir: str, filename: str) -> Optional[str]:
         """
         Get a specific report file from a timestamped directory.
@@ -205,8 +319,8 @@ class TimestampedStorageService:
         """
         try:
             if self.storage_backend == StorageBackend.LOCAL:
-                file_path = Path(timestamped_dir) / filename
-                if file_path.exists():
+                file_path = os.path.join(timestamped_dir, filename)
+                if os.path.exists(file_path):
                     with open(file_path, 'r', encoding='utf-8') as f:
                         return f.read()
                 return None
@@ -215,18 +329,10 @@ class TimestampedStorageService:
                 # For GCS, download the file
                 file_path = f"{timestamped_dir}/{filename}"
                 
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-                    temp_file_path = temp_file.name
-                
-                try:
-                    if self.gcs_service.download_file(file_path, temp_file_path):
-                        with open(temp_file_path, 'r', encoding='utf-8') as f:
-                            return f.read()
+                content = self.gcs_service.download_bytes(file_path)
+                if content is None:
                     return None
-                finally:
-                    if os.path.exists(temp_file_path):
-                        os.unlink(temp_file_path)
+                return content.decode('utf-8')
                         
         except Exception as e:
             self.logger.error(f"Error getting file from timestamped directory: {e}")
@@ -240,70 +346,10 @@ class TimestampedStorageService:
             video_id: Video identifier
             
         Returns:
-            List[Dict[str, Any]]: List of version information
+            List[Dict[str, Any]]: List of version information, newest first
         """
         try:
-            versions = []
-            
-            if self.storage_backend == StorageBackend.LOCAL:
-                base_dir = Path(STORAGE_CONFIG["local"]["outputs_dir"]) / video_id
-                if not base_dir.exists():
-                    return versions
-                
-                for item in base_dir.iterdir():
-                    if item.is_dir():
-                        version_info = {
-                            "directory": str(item),
-                            "timestamp": item.name.split('_')[0] + "_" + item.name.split('_')[1],
-                            "status": "complete" if item.name.endswith('_complete') else "processing",
-                            "has_completion_marker": (item / ".complete_marker").exists()
-                        }
-                        
-                        if version_info["has_completion_marker"]:
-                            try:
-                                with open(item / ".complete_marker", 'r') as f:
-                                    marker_data = json.load(f)
-                                    version_info["completion_data"] = marker_data
-                            except:
-                                pass
-                        
-                        versions.append(version_info)
-                        
-            else:
-                # For GCS, list all directories and check for completion markers
-                base_path = STORAGE_CONFIG["gcs"]["base_path"]
-                prefix = f"{base_path}/{video_id}/"
-                files = self.gcs_service.list_files(prefix)
-                
-                dir_info = {}
-                for file_path in files:
-                    if "/" in file_path[len(prefix):]:
-                        dir_name = file_path[len(prefix):].split("/")[0]
-                        if dir_name not in dir_info:
-                            dir_info[dir_name] = {"files": [], "has_marker": False}
-                        
-                        dir_info[dir_name]["files"].append(file_path)
-                        
-                        if file_path.endswith("/.complete_marker"):
-                            dir_info[dir_name]["has_marker"] = True
-                
-                for dir_name, info in dir_info.items():
-                    # Determine if directory is complete based on presence of completion marker
-                    is_complete = info["has_marker"]
-                    status = "complete" if is_complete else "processing"
-                    
-                    version_info = {
-                        "directory": f"{prefix}{dir_name}",
-                        "timestamp": dir_name.split('_')[0] + "_" + dir_name.split('_')[1] if '_' in dir_name else dir_name,
-                        "status": status,
-                        "has_completion_marker": info["has_marker"],
-                        "file_count": len(info["files"])
-                    }
-                    versions.append(version_info)
-            
-            # Sort by timestamp (newest first)
-            versions.sort(key=lambda x: x["timestamp"], reverse=True)
-            
+            versions = list(self.iter_report_versions(video_id))
             self.logger.info(f"Found {len(versions)} versions for video {video_id}")
             return versions
             
@@ -311,6 +357,90 @@ class TimestampedStorageService:
             self.logger.error(f"Error listing report versions: {e}")
             return []
     
+    def iter_report_versions(self, video_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield report versions for a video, newest first.
+        
+        Locally, completion markers are only read for the versions actually consumed,
+        so callers that stop early skip the rest. On GCS the video's file listing is
+        needed up front for the per-version file counts. Unlike list_report_versions,
+        errors propagate to the caller.
+        
+        Args:
+            video_id: Video identifier
+            
+        Yields:
+            Dict[str, Any]: Version information
+        """
+        if self.storage_backend == StorageBackend.LOCAL:
+            base_dir = os.path.join(STORAGE_CONFIG["local"]["outputs_dir"], video_id)
+            if not os.path.exists(base_dir):
+                return
+            
+            with os.scandir(base_dir) as entries:
+                version_dirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+            
+            # Sort by timestamp (newest first)
+            version_dirs.sort(key=lambda entry: _version_timestamp(entry.name), reverse=True)
+            
+            for item in version_dirs:
+                marker_path = os.path.join(item.path, ".complete_marker")
+                try:
+                    marker_stat = os.stat(marker_path)
+                except OSError:
+                    marker_stat = None
+                version_info = {
+                    "directory": item.path,
+                    "timestamp": _version_timestamp(item.name),
+                    "status": "complete" if item.name.endswith('_complete') else "processing",
+                    "has_completion_marker": marker_stat is not None
+                }
+                
+                if marker_stat is not None:
+                    try:
+                        version_info["completion_data"] = _load_marker_cached(
+                            marker_path, marker_stat.st_mtime_ns, marker_stat.st_size
+                        )
+                    except (OSError, ValueError, json.JSONDecodeError):
+                        pass
+                
+                yield version_info
+                
+        else:
+            # For GCS, list all directories and check for completion markers
+            base_path = STORAGE_CONFIG["gcs"]["base_path"]
+            prefix = f"{base_path}/{video_id}/"
+            files = self.gcs_service.iter_files(prefix)
+            
+            # Per version directory: file count and whether a completion marker exists
+            dir_info = defaultdict(lambda: {"file_count": 0, "has_marker": False})
+            prefix_len = len(prefix)
+            for file_path in files:
+                dir_name, sep, _ = file_path[prefix_len:].partition("/")
+                if not sep:
+                    continue
+                
+                info = dir_info[dir_name]
+                info["file_count"] += 1
+                
+                if file_path.endswith("/.complete_marker"):
+                    info["has_marker"] = True
+            
+            # Sort by timestamp (newest first)
+            for dir_name in sorted(dir_info, key=_version_timestamp, reverse=True):
+                info = dir_info[dir_name]
+                # Determine if directory is complete based on presence of completion marker
+                is_complete = info["has_marker"]
+                status = "complete" if is_complete else "processing"
+                
+                yield {
+                    "directory": f"{prefix}{dir_name}",
+                    "timestamp": _version_timestamp(dir_name),
+                    "status": status,
+                    "has_completion_marker": info["has_marker"],
+                    "file_count": info["file_count"]
+                }
+    
     def cleanup_old_versions(self, video_id: str, keep_count: int = 5) -> bool:
         """
         Clean up old report versions, keeping only the most recent ones.
@@ -334,29 +464,19 @@ class TimestampedStorageService:
             
             for version in versions_to_delete:
                 if self.storage_backend == StorageBackend.LOCAL:
-                    dir_path = Path(version["directory"])
-                    if dir_path.exists():
+                    dir_path = version["directory"]
+                    if os.path.exists(dir_path):
                         shutil.rmtree(dir_path)
                         self.logger.info(f"Deleted old local version: {dir_path}")
                 else:
-                    # For GCS, delete all files in the directory
-                    base_path = STORAGE_CONFIG["gcs"]["base_path"]
-                    prefix = version["directory"].replace(f"{base_path}/", "") + "/"
-                    files = self.gcs_service.list_files(prefix)
-                    
-                    for file_path in files:
-                        # Delete each file (GCS doesn't have directories)
-                        try:
-                            from google.cloud import storage
-                            client = storage.Client()
-                            bucket = client.bucket(STORAGE_CONFIG["gcs"]["bucket_name"])
-                            blob = bucket.blob(file_path)
-                            blob.delete()
-                        except Exception as e:
-                            self.logger.warning(f"Failed to delete GCS file {file_path}: {e}")
+                    # For GCS, delete all files in the directory (GCS doesn't have directories).
+                    # Version directories already include the base path.
+                    files = self.gcs_service.list_files(version["directory"] + "/")
+                    deleted = self.gcs_service.delete_files(files)
                     
-                    self.logger.info(f"Deleted old GCS version: {version['directory']}")
+                    self.logger.info(f"Deleted old GCS version: {version['directory']} ({deleted}/{len(files)} files)")
             
+            unified_storage.forget_cached_reports(video_id)
             self.logger.info(f"Cleaned up {len(versions_to_delete)} old versions for video {video_id}")
             return True
             
@@ -364,17 +484,30 @@ class TimestampedStorageService:
             self.logger.error(f"Error cleaning up old versions: {e}")
             return False
     
+    def list_generated_files(self, timestamped_dir: str) -> List[str]:
+        """
+        List the file names in a report directory.
+        
+        Args:
+            timestamped_dir: Path to the timestamped directory
+            
+        Returns:
+            List[str]: File names (without directory)
+        """
+        return self._list_files_in_directory(timestamped_dir)
+    
     def _list_files_in_directory(self, directory: str) -> List[str]:
         """List all files in a directory."""
         try:
             if self.storage_backend == StorageBackend.LOCAL:
-                dir_path = Path(directory)
-                if dir_path.exists():
-                    return [f.name for f in dir_path.iterdir() if f.is_file()]
-                return []
+                try:
+                    with os.scandir(directory) as entries:
+                        return [entry.name for entry in entries if entry.is_file()]
+                except FileNotFoundError:
+                    return []
             else:
                 # For GCS, list files with the directory prefix
-                files = self.gcs_service.list_files(directory + "/")
+                files = self.gcs_service.iter_files(directory + "/")
                 return [f.split("/")[-1] for f in files if not f.endswith("/")]
         except Exception as e:
             self.logger.error(f"Error listing files in directory: {e}")
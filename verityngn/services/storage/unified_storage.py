@@ -6,17 +6,46 @@ regardless of the underlying storage backend (local filesystem or GCS).
 """
 
 import os
+import re
+import fnmatch
 import logging
 import json
 import zipfile
 import io
-from typing import List, Dict, Any, Optional, Tuple, Union
+import mimetypes
+import threading
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from cachetools import TTLCache
 
 from verityngn.config.settings import STORAGE_CONFIG, STORAGE_BACKEND, StorageBackend
 from verityngn.services.storage.gcs import GCSStorageService
 
+# Report files saved concurrently by save_report_files
+_SAVE_WORKERS = 8
+# Report files read concurrently by create_report_bundle
+_READ_WORKERS = 16
+# Positive report_exists answers are reused for this long
+_EXISTS_CACHE_TTL_SECONDS = 5
+
+# Positive report_exists answers keyed by storage-relative path. Module-level so that
+# deletes through any backend, and the timestamped cleanup, can evict them.
+_report_exists_cache = TTLCache(maxsize=2048, ttl=_EXISTS_CACHE_TTL_SECONDS)
+_report_exists_lock = threading.Lock()
+
+
+def _forget_cached_reports(paths: Iterable[str]) -> None:
+    """Evict cached report_exists answers; a path ending in '/' evicts everything under it."""
+    with _report_exists_lock:
+        for path in paths:
+            if path.endswith('/'):
+                for key in [k for k in _report_exists_cache.keys() if k.startswith(path)]:
+                    _report_exists_cache.pop(key, None)
+            else:
+                _report_exists_cache.pop(path, None)
+
 
 class StorageServiceInterface(ABC):
     """Abstract interface for storage services."""
@@ -117,6 +146,7 @@ class LocalStorageService(StorageServiceInterface):
     
     def delete_file(self, file_path: str) -> bool:
         """Delete a local file."""
+        _forget_cached_reports([file_path])
         try:
             full_path = self._get_full_path(file_path)
             if full_path.exists():
@@ -146,67 +176,52 @@ class GCSStorageServiceAdapter(StorageServiceInterface):
     
     def save_file(self, content: Union[str, bytes], file_path: str) -> str:
         """Save content to GCS."""
-        import tempfile
-        
         gcs_path = self._get_gcs_path(file_path)
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        content_type = mimetypes.guess_type(gcs_path)[0] or "application/octet-stream"
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            if isinstance(content, str):
-                tmp_file.write(content.encode('utf-8'))
-            else:
-                tmp_file.write(content)
-            tmp_file_path = tmp_file.name
-        
-        try:
-            # Upload to GCS
-            success, signed_url = self.gcs_service.upload_file(tmp_file_path, gcs_path)
-            if success:
-                self.logger.info(f"Saved file to GCS: gs://{self.bucket_name}/{gcs_path}")
-                return signed_url or f"gs://{self.bucket_name}/{gcs_path}"
-            else:
-                raise Exception("Failed to upload to GCS")
-        finally:
-            # Clean up temporary file
-            os.unlink(tmp_file_path)
+        # Upload straight from memory
+        if self.gcs_service.upload_bytes(gcs_path, data, content_type=content_type):
+            self.logger.info(f"Saved file to GCS: gs://{self.bucket_name}/{gcs_path}")
+            return self.gcs_service.get_signed_url(gcs_path)
+        else:
+            raise Exception("Failed to upload to GCS")
     
     def read_file(self, file_path: str) -> str:
         """Read content from GCS."""
-        import tempfile
-        
         gcs_path = self._get_gcs_path(file_path)
         
-        with tempfile.NamedTemporaryFile() as tmp_file:
-            if self.gcs_service.download_file(gcs_path, tmp_file.name):
-                with open(tmp_file.name, 'r', encoding='utf-8') as f:
-                    return f.read()
-            else:
-                raise FileNotFoundError(f"File not found in GCS: gs://{self.bucket_name}/{gcs_path}")
+        content = self.gcs_service.download_bytes(gcs_path)
+        if content is None:
+            raise FileNotFoundError(f"File not found in GCS: gs://{self.bucket_name}/{gcs_path}")
+        return content.decode('utf-8')
     
     def file_exists(self, file_path: str) -> bool:
         """Check if file exists in GCS."""
         gcs_path = self._get_gcs_path(file_path)
-        files = self.gcs_service.list_files(gcs_path)
-        return gcs_path in files
+        return self.gcs_service.file_exists(gcs_path)
     
     def list_files(self, directory_path: str, pattern: str = "*") -> List[str]:
         """List files in GCS with directory prefix."""
         gcs_prefix = self._get_gcs_path(directory_path)
-        files = self.gcs_service.list_files(gcs_prefix)
+        # List the directory's contents only, not sibling paths sharing the name as a prefix
+        list_prefix = gcs_prefix if not gcs_prefix or gcs_prefix.endswith("/") else f"{gcs_prefix}/"
         
-        # Filter by pattern if needed (simple implementation)
+        # Filter by pattern if needed (simple implementation), compiling the glob once
+        pattern_re = None
         if pattern != "*":
-            import fnmatch
-            files = [f for f in files if fnmatch.fnmatch(f, f"{gcs_prefix}/*{pattern}")]
+            pattern_re = re.compile(fnmatch.translate(f"{gcs_prefix}/*{pattern}"))
         
-        # Return relative paths
+        # Single pass over the paginated listing, returning paths relative to base_path
+        base_prefix = f"{self.base_path}/" if self.base_path else ""
+        base_prefix_len = len(base_prefix)
         result = []
-        for file_path in files:
-            if self.base_path:
-                rel_path = file_path.replace(f"{self.base_path}/", "", 1)
-            else:
-                rel_path = file_path
-            result.append(rel_path)
+        for file_path in self.gcs_service.iter_files(list_prefix):
+            if pattern_re is not None and not pattern_re.match(file_path):
+                continue
+            if base_prefix and file_path.startswith(base_prefix):
+                file_path = file_path[base_prefix_len:]
+            result.append(file_path)
         
         return result
     
@@ -214,41 +229,17 @@ class GCSStorageServiceAdapter(StorageServiceInterface):
         """Get signed URL for GCS file."""
         gcs_path = self._get_gcs_path(file_path)
         
-        # Generate signed URL
-        try:
-            from google.cloud import storage
-            from datetime import timedelta
-            
-            client = storage.Client()
-            bucket = client.bucket(self.bucket_name)
-            blob = bucket.blob(gcs_path)
-            
-            signed_url = blob.generate_signed_url(
-                version="v4",
-                expiration=timedelta(days=7),
-                method="GET"
-            )
-            return signed_url
-        except Exception as e:
-            self.logger.error(f"Error generating signed URL: {e}")
-            return f"gs://{self.bucket_name}/{gcs_path}"
+        # 7-day signed URL from the shared client (gs:// path if signing fails)
+        return self.gcs_service.get_signed_url(gcs_path)
     
     def delete_file(self, file_path: str) -> bool:
         """Delete file from GCS."""
-        try:
-            gcs_path = self._get_gcs_path(file_path)
-            from google.cloud import storage
-            
-            client = storage.Client()
-            bucket = client.bucket(self.bucket_name)
-            blob = bucket.blob(gcs_path)
-            
-            blob.delete()
+        _forget_cached_reports([file_path])
+        gcs_path = self._get_gcs_path(file_path)
+        if self.gcs_service.delete_file(gcs_path):
             self.logger.info(f"Deleted GCS file: gs://{self.bucket_name}/{gcs_path}")
             return True
-        except Exception as e:
-            self.logger.error(f"Error deleting GCS file {file_path}: {e}")
-            return False
+        return False
 
 
 class UnifiedStorageService:
@@ -289,15 +280,23 @@ class UnifiedStorageService:
             Dict mapping filename to accessible URL
         """
         urls = {}
+        if not files:
+            return urls
         
-        for filename, content in files.items():
-            file_path = f"{video_id}/{filename}"
-            try:
-                url = self.storage.save_file(content, file_path)
-                urls[filename] = url
-                self.logger.info(f"Saved report file: {filename}")
-            except Exception as e:
-                self.logger.error(f"Error saving file {filename}: {e}")
+        _forget_cached_reports(f"{video_id}/{filename}" for filename in files)
+        
+        # Uploads are independent and network-bound, so overlap them on a small pool
+        with ThreadPoolExecutor(max_workers=min(_SAVE_WORKERS, len(files))) as executor:
+            futures = [
+                (filename, executor.submit(self.storage.save_file, content, f"{video_id}/{filename}"))
+                for filename, content in files.items()
+            ]
+            for filename, future in futures:
+                try:
+                    urls[filename] = future.result()
+                    self.logger.info(f"Saved report file: {filename}")
+                except Exception as e:
+                    self.logger.error(f"Error saving file {filename}: {e}")
                 
         return urls
     
@@ -309,7 +308,21 @@ class UnifiedStorageService:
     def report_exists(self, video_id: str, filename: str) -> bool:
         """Check if a report file exists."""
         file_path = f"{video_id}/{filename}"
-        return self.storage.file_exists(file_path)
+        with _report_exists_lock:
+            if file_path in _report_exists_cache:
+                return True
+        
+        exists = self.storage.file_exists(file_path)
+        # Only hits are cached: files are also written through self.storage directly,
+        # so a cached miss could hide a new report
+        if exists:
+            with _report_exists_lock:
+                _report_exists_cache[file_path] = True
+        return exists
+    
+    def forget_cached_reports(self, video_id: str) -> None:
+        """Drop cached report_exists answers for a video, e.g. after its files were deleted."""
+        _forget_cached_reports([f"{video_id}/"])
     
     def list_reports(self, video_id: Optional[str] = None) -> List[str]:
         """List available reports."""
@@ -323,11 +336,19 @@ class UnifiedStorageService:
         file_path = f"{video_id}/{filename}"
         return self.storage.get_file_url(file_path)
     
-    def create_report_bundle(self, video_id: str, format: str = "json") -> Union[Dict[str, Any], bytes]:
-        """Create a bundle of all report files for a video."""
+    def create_report_bundle(self, video_id: str, format: str = "json",
+                             compresslevel: int = 1) -> Union[Dict[str, Any], bytes]:
+        """
+        Create a bundle of all report files for a video.
+        
+        Formats are "json", "zip" (deflated at compresslevel; 1 trades a little size
+        for much faster bundling) and "zip-stored" (uncompressed).
+        """
         files = self.list_reports(video_id)
-        report_files = [f for f in files if any(f.endswith(ext) for ext in ['.html', '.md', '.json']) 
-                       and ('report' in f or 'claim_' in f)]
+        report_files = [f for f in files if f.endswith(('.html', '.md', '.json'))
+                        and ('report' in f or 'claim_' in f)]
+        prefix = f"{video_id}/"
+        prefix_len = len(prefix)
         
         if format.lower() == "json":
             bundle = {
@@ -335,16 +356,12 @@ class UnifiedStorageService:
                 "files": {}
             }
             
-            for file_path in report_files:
+            for file_path, content_future in self._read_files_concurrently(report_files):
                 try:
                     # Extract filename from path (remove video_id prefix if present)
-                    if file_path.startswith(f"{video_id}/"):
-                        filename = file_path[len(f"{video_id}/"):]
-                    else:
-                        filename = file_path
+                    filename = file_path[prefix_len:] if file_path.startswith(prefix) else file_path
                     
-                    # Read file using the storage interface directly
-                    content = self.storage.read_file(file_path)
+                    content = content_future.result()
                     
                     if filename.endswith('.json'):
                         bundle["files"][filename] = json.loads(content)
@@ -355,29 +372,41 @@ class UnifiedStorageService:
             
             return bundle
             
-        elif format.lower() == "zip":
+        elif format.lower() in ("zip", "zip-stored"):
             zip_buffer = io.BytesIO()
+            if format.lower() == "zip-stored":
+                zip_args = {"compression": zipfile.ZIP_STORED}
+            else:
+                zip_args = {"compression": zipfile.ZIP_DEFLATED, "compresslevel": compresslevel}
             
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                for file_path in report_files:
+            with zipfile.ZipFile(zip_buffer, 'w', **zip_args) as zip_file:
+                for file_path, content_future in self._read_files_concurrently(report_files):
                     try:
                         # Extract filename from path (remove video_id prefix if present)
-                        if file_path.startswith(f"{video_id}/"):
-                            filename = file_path[len(f"{video_id}/"):]
-                        else:
-                            filename = file_path
+                        filename = file_path[prefix_len:] if file_path.startswith(prefix) else file_path
                         
-                        # Read file using the storage interface directly
-                        content = self.storage.read_file(file_path)
+                        content = content_future.result()
                         zip_file.writestr(filename, content)
                     except Exception as e:
                         self.logger.warning(f"Could not add file {file_path} to ZIP: {e}")
             
-            zip_buffer.seek(0)
             return zip_buffer.getvalue()
         
         else:
             raise ValueError(f"Unsupported bundle format: {format}")
 
+    def _read_files_concurrently(self, file_paths: List[str]) -> List[Tuple[str, Future]]:
+        """
+        Read files through the storage interface on a thread pool.
+        
+        Returns (file_path, future) pairs in input order once all reads have finished;
+        a failed read raises from its future's result().
+        """
+        if not file_paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(file_paths))) as executor:
+            return [(file_path, executor.submit(self.storage.read_file, file_path)) for file_path in file_paths]
+
 # Create singleton instance
 unified_storage = UnifiedStorageService() 
\ No newline at end of file
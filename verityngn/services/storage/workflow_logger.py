@@ -3,14 +3,27 @@ import json
 import time
 import os
 import threading
-from typing import Dict, Any, List, Optional, Union
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Union
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional: faster log entry serialization
+except ImportError:
+    orjson = None
 
 from verityngn.config.settings import GCS_BUCKET_NAME, STORAGE_BACKEND, StorageBackend
 from verityngn.services.storage.gcs import GCSStorageService
 
+# Local JSONL log: buffered writes, flushed every N entries (and on errors, upload and finalize)
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_EVERY = 64
+# Most recent entries kept in memory; the summary is aggregated as events arrive
+_LOG_ENTRIES_MAXLEN = 10_000
+
 
 @dataclass
 class WorkflowLogEntry:
@@ -32,6 +45,27 @@ class WorkflowLogEntry:
         return asdict(self)
 
 
+def _entry_json_line(entry: WorkflowLogEntry) -> bytes:
+    """Serialize a log entry as one JSONL line, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            # orjson encodes dataclasses natively, without asdict's deep copy
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. big ints, which only the stdlib encoder accepts
+    return (json.dumps(entry.to_dict()) + '\n').encode('utf-8')
+
+
+def _summary_json(summary: Dict[str, Any]) -> bytes:
+    """Serialize the workflow summary as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(summary, indent=2).encode('utf-8')
+
+
 class WorkflowLogger:
     """
     Comprehensive workflow logger for VerityNgn.
@@ -51,14 +85,25 @@ class WorkflowLogger:
         self.logger = logging.getLogger(__name__)
         
         # Initialize log storage
-        self.log_entries: List[WorkflowLogEntry] = []
-        self.current_step_start_times: Dict[str, float] = {}
+        self.log_entries: Deque[WorkflowLogEntry] = deque(maxlen=_LOG_ENTRIES_MAXLEN)
+        self.current_step_start_times: Dict[str, int] = {}  # perf_counter_ns at step start
         self._lock = threading.Lock()
         
+        # Running summary aggregates (see _record_in_summary)
+        self._total_events = 0
+        self._start_time: Optional[str] = None
+        self._summary_steps: Dict[str, Dict[str, Any]] = {}
+        self._summary_llm_calls: List[Dict[str, Any]] = []
+        self._summary_errors: List[Dict[str, Any]] = []
+        self._token_usage_total = {"input_tokens": 0, "output_tokens": 0}
+        
         # Create local log directory
         self.local_log_dir = Path(f"/tmp/workflow_logs/{video_id}")
         self.local_log_dir.mkdir(parents=True, exist_ok=True)
         self.local_log_file = self.local_log_dir / f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        # Append handle kept open across events; opened on first write
+        self._log_file = None
+        self._unflushed_entries = 0
         
         # Initialize GCS if enabled
         self.gcs_service = None
@@ -94,11 +139,17 @@ class WorkflowLogger:
             )
             
             self.log_entries.append(entry)
+            self._record_in_summary(entry)
             
-            # Write to local file immediately
+            # Append to the local file; errors are flushed right away
             try:
-                with open(self.local_log_file, 'a') as f:
-                    f.write(json.dumps(entry.to_dict()) + '\n')
+                if self._log_file is None:
+                    self._log_file = open(self.local_log_file, 'ab', buffering=_LOG_BUFFER_SIZE)
+                self._log_file.write(_entry_json_line(entry))
+                self._unflushed_entries += 1
+                if step_type == "error" or self._unflushed_entries >= _LOG_FLUSH_EVERY:
+                    self._log_file.flush()
+                    self._unflushed_entries = 0
             except Exception as e:
                 self.logger.error(f"Failed to write to local log file: {e}")
             
@@ -108,17 +159,70 @@ class WorkflowLogger:
             else:
                 self.logger.info(f"[{self.video_id}] {step_name} ({step_type}) - {status}")
     
+    def _record_in_summary(self, entry: WorkflowLogEntry) -> None:
+        """Fold a new entry into the running summary aggregates. Caller holds self._lock."""
+        self._total_events += 1
+        if self._start_time is None:
+            self._start_time = entry.timestamp
+        
+        # Track steps
+        if entry.step_type == "state_transition":
+            step = self._summary_steps.setdefault(entry.step_name, {"status": "unknown", "duration_ms": 0})
+            if entry.status in ["completed", "failed"]:
+                step["status"] = entry.status
+                if entry.duration_ms:
+                    step["duration_ms"] = entry.duration_ms
+        
+        # Track LLM calls
+        elif entry.step_type == "llm_call":
+            self._summary_llm_calls.append({
+                "step_name": entry.step_name,
+                "model_name": entry.model_name,
+                "duration_ms": entry.duration_ms,
+                "status": entry.status,
+                "token_usage": entry.token_usage
+            })
+            
+            # Aggregate token usage
+            if entry.token_usage:
+                self._token_usage_total["input_tokens"] += entry.token_usage.get("input_tokens", 0)
+                self._token_usage_total["output_tokens"] += entry.token_usage.get("output_tokens", 0)
+        
+        # Track errors
+        elif entry.step_type == "error":
+            self._summary_errors.append({
+                "step_name": entry.step_name,
+                "error_message": entry.error_message,
+                "timestamp": entry.timestamp
+            })
+    
+    def _flush_log_file(self, close: bool = False) -> None:
+        """Flush buffered entries to the local log file, optionally closing it."""
+        with self._lock:
+            if self._log_file is None:
+                return
+            try:
+                self._log_file.flush()
+                self._unflushed_entries = 0
+                if close:
+                    self._log_file.close()
+            except Exception as e:
+                self.logger.error(f"Failed to flush local log file: {e}")
+            finally:
+                if close:
+                    self._log_file = None
+    
     def start_step(self, step_name: str) -> None:
         """Mark the start of a workflow step."""
-        self.current_step_start_times[step_name] = time.time()
+        self.current_step_start_times[step_name] = time.perf_counter_ns()
         self._log_event(step_name, "state_transition", status="started")
     
     def complete_step(self, step_name: str, output_data: Optional[Dict[str, Any]] = None) -> None:
         """Mark the completion of a workflow step."""
         duration_ms = None
-        if step_name in self.current_step_start_times:
-            duration_ms = int((time.time() - self.current_step_start_times[step_name]) * 1000)
-            del self.current_step_start_times[step_name]
+        start_ns = self.current_step_start_times.pop(step_name, None)
+        if start_ns is not None:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         self._log_event(step_name, "state_transition", 
                        data={"output": output_data} if output_data else None,
@@ -160,13 +264,13 @@ class WorkflowLogger:
         if isinstance(content, str):
             return content[:max_length] + "..." if len(content) > max_length else content
         elif isinstance(content, dict):
-            truncated = {}
-            for key, value in content.items():
-                if isinstance(value, str) and len(value) > max_length:
-                    truncated[key] = value[:max_length] + "..."
-                else:
-                    truncated[key] = value
-            return truncated
+            # Most payloads are small: only copy when something actually needs cutting
+            if not any(isinstance(value, str) and len(value) > max_length for value in content.values()):
+                return content
+            return {
+                key: value[:max_length] + "..." if isinstance(value, str) and len(value) > max_length else value
+                for key, value in content.items()
+            }
         return content
     
     def upload_to_gcs(self) -> Optional[str]:
@@ -179,23 +283,34 @@ class WorkflowLogger:
             # Create summary log
             summary = self._create_workflow_summary()
             
-            # Upload detailed log
-            gcs_log_path = f"workflow_logs/{self.video_id}/detailed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
-            success, _ = self.gcs_service.upload_file(str(self.local_log_file), gcs_log_path)
+            self._flush_log_file()
+            upload_time = datetime.now().strftime('%Y%m%d_%H%M%S')
+            gcs_log_path = f"workflow_logs/{self.video_id}/detailed_{upload_time}.jsonl"
+            gcs_summary_path = f"workflow_logs/{self.video_id}/summary_{upload_time}.json"
+            
+            # Keep a local copy of the summary; the bytes are serialized once for both
+            summary_json = _summary_json(summary)
+            summary_file = self.local_log_dir / "summary.json"
+            summary_file.write_bytes(summary_json)
+            
+            # Upload the detailed log and the summary side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                log_upload = executor.submit(self.gcs_service.upload_file, str(self.local_log_file), gcs_log_path)
+                summary_upload = executor.submit(self.gcs_service.upload_bytes, gcs_summary_path, summary_json,
+                                                 "application/json")
+            success, _ = log_upload.result()
+            summary_uploaded = summary_upload.result()
             
             if success:
-                # Upload summary
-                summary_file = self.local_log_dir / "summary.json"
-                with open(summary_file, 'w') as f:
-                    json.dump(summary, f, indent=2)
-                
-                gcs_summary_path = f"workflow_logs/{self.video_id}/summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                self.gcs_service.upload_file(str(summary_file), gcs_summary_path)
-                
+                if not summary_uploaded:
+                    self.logger.error("Failed to upload workflow summary to GCS")
                 self.logger.info(f"Workflow logs uploaded to GCS: gs://{GCS_BUCKET_NAME}/{gcs_log_path}")
                 return f"gs://{GCS_BUCKET_NAME}/{gcs_log_path}"
             else:
                 self.logger.error("Failed to upload workflow logs to GCS")
+                # A summary without its detailed log is not a usable upload
+                if summary_uploaded:
+                    self.gcs_service.delete_file(gcs_summary_path)
                 return None
                 
         except Exception as e:
@@ -204,63 +319,27 @@ class WorkflowLogger:
     
     def _create_workflow_summary(self) -> Dict[str, Any]:
         """Create a workflow execution summary."""
-        summary = {
-            "video_id": self.video_id,
-            "start_time": self.log_entries[0].timestamp if self.log_entries else None,
-            "end_time": self.log_entries[-1].timestamp if self.log_entries else None,
-            "total_events": len(self.log_entries),
-            "steps": {},
-            "llm_calls": [],
-            "errors": [],
-            "token_usage_total": {"input_tokens": 0, "output_tokens": 0}
-        }
-        
-        # Analyze log entries
-        for entry in self.log_entries:
-            # Track steps
-            if entry.step_type == "state_transition":
-                if entry.step_name not in summary["steps"]:
-                    summary["steps"][entry.step_name] = {"status": "unknown", "duration_ms": 0}
-                
-                if entry.status in ["completed", "failed"]:
-                    summary["steps"][entry.step_name]["status"] = entry.status
-                    if entry.duration_ms:
-                        summary["steps"][entry.step_name]["duration_ms"] = entry.duration_ms
-            
-            # Track LLM calls
-            elif entry.step_type == "llm_call":
-                llm_call = {
-                    "step_name": entry.step_name,
-                    "model_name": entry.model_name,
-                    "duration_ms": entry.duration_ms,
-                    "status": entry.status,
-                    "token_usage": entry.token_usage
-                }
-                summary["llm_calls"].append(llm_call)
-                
-                # Aggregate token usage
-                if entry.token_usage:
-                    summary["token_usage_total"]["input_tokens"] += entry.token_usage.get("input_tokens", 0)
-                    summary["token_usage_total"]["output_tokens"] += entry.token_usage.get("output_tokens", 0)
-            
-            # Track errors
-            elif entry.step_type == "error":
-                summary["errors"].append({
-                    "step_name": entry.step_name,
-                    "error_message": entry.error_message,
-                    "timestamp": entry.timestamp
-                })
-        
-        return summary
+        with self._lock:
+            return {
+                "video_id": self.video_id,
+                "start_time": self._start_time,
+                "end_time": self.log_entries[-1].timestamp if self.log_entries else None,
+                "total_events": self._total_events,
+                "steps": {name: dict(step) for name, step in self._summary_steps.items()},
+                "llm_calls": list(self._summary_llm_calls),
+                "errors": list(self._summary_errors),
+                "token_usage_total": dict(self._token_usage_total)
+            }
     
     def finalize(self) -> Optional[str]:
         """Finalize the workflow logging and upload to GCS."""
         self._log_event("workflow_end", "info", {
-            "total_events": len(self.log_entries),
-            "final_status": "completed" if not any(e.step_type == "error" for e in self.log_entries) else "failed"
+            "total_events": self._total_events,
+            "final_status": "completed" if not self._summary_errors else "failed"
         })
         
         # Upload to GCS
+        self._flush_log_file(close=True)
         gcs_path = self.upload_to_gcs()
         
         # Clean up local files (optional)
@@ -8,25 +8,38 @@ composed of claim clips with text overlays and explanations.
 import os
 import re
 import json
+import atexit
+import hashlib
 import logging
+import shutil
 import subprocess
+import tempfile
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 from pathlib import Path
 
 try:
     from moviepy.editor import (
         VideoFileClip,
-        TextClip,
-        CompositeVideoClip,
+        ImageClip,
         concatenate_videoclips,
-        ColorClip,
     )
     MOVIEPY_AVAILABLE = True
 except ImportError:
     MOVIEPY_AVAILABLE = False
 
+# Pillow renders the static intro/transition cards
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 from verityngn.utils.file_utils import extract_video_id
 
 logger = logging.getLogger(__name__)
@@ -38,6 +51,89 @@ try:
 except ImportError:
     GCS_AVAILABLE = False
 
+# Hardware H.264 encoders tried in order when ClipConfig.hw_accel is "auto"
+_HW_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox")
+
+# Claim caption: bottom band height and font size, and average glyph width (in ems)
+# used to wrap the caption to the frame width
+_CAPTION_BAND_HEIGHT = 160
+_CAPTION_FONT_SIZE = 36
+_VERDICT_FONT_SIZE = 42
+_AVG_GLYPH_WIDTH_EM = 0.5
+
+# Seek this far before the clip with -ss on the input (fast, keyframe-based), then
+# decode the remainder exactly
+_COARSE_SEEK_MARGIN = 2.0
+
+
+def _filter_escape(value: str) -> str:
+    """
+    Escape a value for an ffmpeg filtergraph option.
+    
+    Values are unescaped twice, once by the option parser (":" separates options)
+    and once by the filtergraph parser ("," "[" "]" ";" separate filters).
+    """
+    option_level = re.sub(r"([\\':])", r"\\\1", value)
+    return re.sub(r"([\\'\[\],;])", r"\\\1", option_level)
+
+
+# Rendered intro/transition card PNGs, keyed by content and shared by all
+# ClipGenerator instances; created on first use and removed at exit
+_card_cache_dir: Optional[str] = None
+_card_cache_dir_lock = threading.Lock()
+
+
+def _get_card_cache_dir() -> str:
+    """Return the process-wide card cache directory, creating it on first use."""
+    global _card_cache_dir
+    with _card_cache_dir_lock:
+        if _card_cache_dir is None:
+            _card_cache_dir = tempfile.mkdtemp(prefix="verityngn_cards_")
+            atexit.register(shutil.rmtree, _card_cache_dir, ignore_errors=True)
+        return _card_cache_dir
+
+
+@lru_cache(maxsize=32)
+def _load_card_font(font: str, size: int) -> Any:
+    """
+    Load a TrueType font for card rendering.
+    
+    Accepts a font file path or a name like "Arial-Bold", trying common file names
+    and DejaVu before Pillow's built-in font.
+    """
+    bold = font.lower().endswith("-bold")
+    candidates = [font, f"{font}.ttf", f"{font.replace('-', '')}.ttf", f"{font.split('-')[0]}.ttf"]
+    candidates.append("DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf")
+    for candidate in candidates:
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    # load_default(size=...) needs Pillow >= 10.1; keep the requirements pin at or above it
+    return ImageFont.load_default(size=size)
+
+
+@lru_cache(maxsize=8)
+def _drawtext_fallback_font_file(font: str) -> Optional[str]:
+    """
+    Font file for drawtext when ffmpeg has no fontconfig to resolve font names.
+    
+    Uses the file Pillow resolves for the card font (see _load_card_font); warns once
+    per font, since overlays cannot be drawn if no file is found.
+    """
+    font_file = None
+    if PIL_AVAILABLE:
+        # Pillow's built-in fallback font is in memory and has no usable path
+        path = getattr(_load_card_font(font, _CAPTION_FONT_SIZE), "path", None)
+        if isinstance(path, str) and os.path.isfile(path):
+            font_file = path
+    if font_file:
+        logger.warning(f"ffmpeg was built without fontconfig; drawing '{font}' overlays with {font_file}")
+    else:
+        logger.warning(f"ffmpeg was built without fontconfig and no font file was found for '{font}'; "
+                       f"claim overlays will fail (set ClipConfig.overlay_font to a .ttf path)")
+    return font_file
+
 
 class VerdictType(Enum):
     """Verdict types for claims."""
@@ -63,6 +159,9 @@ class ClipConfig:
     output_fps: int = 24
     output_codec: str = "libx264"
     output_audio_codec: str = "aac"
+    hw_accel: Optional[str] = "auto"  # "auto", an ffmpeg encoder name, or None for libx264
+    x264_tune: str = "zerolatency"
+    parallel_workers: int = min(4, os.cpu_count() or 1)  # concurrent ffmpeg clip extractions
 
 
 @dataclass 
@@ -92,6 +191,15 @@ class ClipGenerator:
     - Compose tutorial videos with transitions
     """
     
+    # `ffmpeg -encoders` output, probed once per process
+    _ffmpeg_encoders: Optional[str] = None
+    _ffmpeg_encoders_lock = threading.Lock()
+    # `ffmpeg -buildconf` output, probed once per process
+    _ffmpeg_buildconf: Optional[str] = None
+    _ffmpeg_buildconf_lock = threading.Lock()
+    # Hardware encoders that failed where libx264 then succeeded; not tried again
+    _failed_hw_encoders: set = set()
+    
     def __init__(self, config: Optional[ClipConfig] = None):
         """Initialize the ClipGenerator with optional configuration."""
         self.config = config or ClipConfig()
@@ -271,47 +379,47 @@ class ClipGenerator:
         # Clean up the string
         timestamp_str = timestamp_str.strip()
         
-        def parse_single_timestamp(ts: str) -> float:
-            """Parse a single MM:SS or HH:MM:SS timestamp."""
-            ts = ts.strip()
-            parts = ts.split(':')
-            
-            try:
-                if len(parts) == 1:
-                    # Just seconds
-                    return float(parts[0])
-                elif len(parts) == 2:
-                    # MM:SS
-                    minutes = int(parts[0])
-                    # Handle truncated seconds like "4" instead of "45"
-                    seconds_str = parts[1]
-                    if len(seconds_str) == 1:
-                        # Truncated - assume it's the first digit of seconds
-                        seconds = int(seconds_str) * 10
-                    else:
-                        seconds = float(seconds_str)
-                    return minutes * 60 + seconds
-                elif len(parts) == 3:
-                    # HH:MM:SS
-                    hours = int(parts[0])
-                    minutes = int(parts[1])
-                    seconds = float(parts[2])
-                    return hours * 3600 + minutes * 60 + seconds
-            except (ValueError, IndexError) as e:
-                self.logger.warning(f"Could not parse timestamp '{ts}': {e}")
-            
-            return 0.0
-        
         # Check for range format (start-end)
         if '-' in timestamp_str:
             parts = timestamp_str.split('-')
             if len(parts) == 2:
-                start = parse_single_timestamp(parts[0])
-                end = parse_single_timestamp(parts[1])
+                start = self._parse_single_timestamp(parts[0])
+                end = self._parse_single_timestamp(parts[1])
                 return (start, end if end > start else None)
         
         # Single timestamp
-        return (parse_single_timestamp(timestamp_str), None)
+        return (self._parse_single_timestamp(timestamp_str), None)
+    
+    def _parse_single_timestamp(self, ts: str) -> float:
+        """Parse a single MM:SS or HH:MM:SS timestamp."""
+        ts = ts.strip()
+        parts = ts.split(':')
+        
+        try:
+            if len(parts) == 1:
+                # Just seconds
+                return float(parts[0])
+            elif len(parts) == 2:
+                # MM:SS
+                minutes = int(parts[0])
+                # Handle truncated seconds like "4" instead of "45"
+                seconds_str = parts[1]
+                if len(seconds_str) == 1:
+                    # Truncated - assume it's the first digit of seconds
+                    seconds = int(seconds_str) * 10
+                else:
+                    seconds = float(seconds_str)
+                return minutes * 60 + seconds
+            elif len(parts) == 3:
+                # HH:MM:SS
+                hours = int(parts[0])
+                minutes = int(parts[1])
+                seconds = float(parts[2])
+                return hours * 3600 + minutes * 60 + seconds
+        except (ValueError, IndexError) as e:
+            self.logger.warning(f"Could not parse timestamp '{ts}': {e}")
+        
+        return 0.0
     
     # =========================================================================
     # Claim Ranker
@@ -380,6 +488,10 @@ class ClipGenerator:
         
         return claim.get('initial_assessment', 'UNCERTAIN')
     
+    def _score_claims(self, claims: List[Dict[str, Any]]) -> List[Tuple[float, Dict[str, Any]]]:
+        """Pair each claim with its FALSE probability, computed once per claim."""
+        return [(self.get_false_probability(claim), claim) for claim in claims]
+    
     def rank_claims_by_severity(
         self, 
         claims: List[Dict[str, Any]], 
@@ -395,11 +507,9 @@ class ClipGenerator:
         Returns:
             Sorted list of claims
         """
-        ranked = sorted(
-            claims,
-            key=lambda c: self.get_false_probability(c),
-            reverse=not ascending
-        )
+        scored = self._score_claims(claims)
+        scored.sort(key=lambda scored_claim: scored_claim[0], reverse=not ascending)
+        ranked = [claim for _, claim in scored]
         
         self.logger.info(
             f"Ranked {len(ranked)} claims by severity "
@@ -431,18 +541,20 @@ class ClipGenerator:
             return claims
         
         selected = []
+        scored = self._score_claims(claims)
         
         # Get worst claims (highest FALSE probability)
         if top_n_worst > 0:
-            worst = self.rank_claims_by_severity(claims, ascending=False)[:top_n_worst]
-            selected.extend(worst)
+            worst = sorted(scored, key=lambda scored_claim: scored_claim[0], reverse=True)[:top_n_worst]
+            selected.extend(claim for _, claim in worst)
         
         # Get best claims (lowest FALSE probability)
         if top_n_best > 0:
-            best = self.rank_claims_by_severity(claims, ascending=True)[:top_n_best]
+            best = sorted(scored, key=lambda scored_claim: scored_claim[0])[:top_n_best]
             # Add only if not already in selected
-            for claim in best:
-                if claim not in selected:
+            selected_ids = {id(claim) for claim in selected}
+            for _, claim in best:
+                if id(claim) not in selected_ids:
                     selected.append(claim)
         
         self.logger.info(
@@ -456,6 +568,96 @@ class ClipGenerator:
     # Clip Extractor
     # =========================================================================
     
+    @classmethod
+    def _available_ffmpeg_encoders(cls) -> str:
+        """Return the `ffmpeg -encoders` listing, probing ffmpeg only once."""
+        with cls._ffmpeg_encoders_lock:
+            if cls._ffmpeg_encoders is None:
+                try:
+                    result = subprocess.run(
+                        ["ffmpeg", "-hide_banner", "-encoders"],
+                        capture_output=True, text=True, timeout=10
+                    )
+                    cls._ffmpeg_encoders = result.stdout if result.returncode == 0 else ""
+                except Exception:
+                    cls._ffmpeg_encoders = ""
+            return cls._ffmpeg_encoders
+    
+    @classmethod
+    def _ffmpeg_build_configuration(cls) -> str:
+        """Return the `ffmpeg -buildconf` listing, probing ffmpeg only once."""
+        with cls._ffmpeg_buildconf_lock:
+            if cls._ffmpeg_buildconf is None:
+                try:
+                    result = subprocess.run(
+                        ["ffmpeg", "-hide_banner", "-buildconf"],
+                        capture_output=True, text=True, timeout=10
+                    )
+                    cls._ffmpeg_buildconf = result.stdout if result.returncode == 0 else ""
+                except Exception:
+                    cls._ffmpeg_buildconf = ""
+            return cls._ffmpeg_buildconf
+    
+    def _clip_encoder_args(self) -> List[str]:
+        """
+        Pick the video encoder for clip extraction.
+        
+        Uses a hardware H.264 encoder when one is configured or detected, otherwise a
+        fast libx264 preset.
+        """
+        encoder = self.config.hw_accel
+        if encoder == "auto":
+            encoders = self._available_ffmpeg_encoders()
+            encoder = next((name for name in _HW_ENCODERS if name in encoders), None)
+        if encoder in self._failed_hw_encoders:
+            encoder = None
+        
+        if encoder == "h264_nvenc":
+            return ["-hwaccel", "cuda", "-c:v", encoder, "-preset", "p1", "-tune", "ll"]
+        if encoder == "h264_qsv":
+            return ["-c:v", encoder, "-preset", "veryfast"]
+        if encoder:
+            return ["-c:v", encoder]
+        return self._x264_encoder_args()
+    
+    def _x264_encoder_args(self) -> List[str]:
+        """Fast software H.264 encoding for clip extraction."""
+        return [
+            "-c:v", "libx264", "-preset", "ultrafast", "-tune", self.config.x264_tune,
+            "-crf", "28", "-threads", "4"
+        ]
+    
+    def _clip_extract_cmd(
+        self,
+        video_path: str,
+        output_path: str,
+        clip_start: float,
+        clip_duration: float,
+        encoder_args: List[str]
+    ) -> List[str]:
+        """Build the ffmpeg command for a frame-accurate clip extraction."""
+        # Two-stage seek: keyframe seek on the input, exact seek on the decoded stream
+        coarse_start = max(0.0, clip_start - _COARSE_SEEK_MARGIN)
+        fine_start = clip_start - coarse_start
+        
+        # Input options (e.g. -hwaccel) must precede -i
+        input_args = encoder_args[:2] if encoder_args[0] == "-hwaccel" else []
+        output_args = encoder_args[len(input_args):]
+        
+        return [
+            "ffmpeg",
+            "-y",  # Overwrite output
+            *input_args,
+            "-ss", str(coarse_start),
+            "-i", video_path,
+            "-ss", str(fine_start),
+            "-t", str(clip_duration),
+            *output_args,
+            "-c:a", self.config.output_audio_codec,
+            "-avoid_negative_ts", "make_zero",
+            output_path
+        ]
+    
     def extract_claim_clip_ffmpeg(
         self,
         video_path: str,
@@ -464,7 +666,11 @@ class ClipGenerator:
         claim_index: int
     ) -> Optional[ClaimClip]:
         """
-        Extract a clip for a single claim using ffmpeg (fast, no re-encoding).
+        Extract a frame-accurate clip for a single claim using ffmpeg.
+        
+        Seeks coarsely on the input, then exactly after decoding, and re-encodes with a
+        fast (hardware when available) H.264 encoder, so clips start on the claim
+        rather than on the previous keyframe.
         
         Args:
             video_path: Path to source video
@@ -495,20 +701,23 @@ class ClipGenerator:
         video_id = os.path.splitext(os.path.basename(video_path))[0]
         output_path = os.path.join(output_dir, f"{video_id}_claim_{claim_index:02d}.mp4")
         
-        # Extract clip using ffmpeg
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output
-            "-ss", str(clip_start),
-            "-i", video_path,
-            "-t", str(clip_duration),
-            "-c", "copy",  # Copy without re-encoding for speed
-            "-avoid_negative_ts", "make_zero",
-            output_path
-        ]
+        encoder_args = self._clip_encoder_args()
+        cmd = self._clip_extract_cmd(video_path, output_path, clip_start, clip_duration, encoder_args)
         
         try:
             result = subprocess.run(cmd, capture_output=True, text=True)
+            x264_args = self._x264_encoder_args()
+            if result.returncode != 0 and encoder_args != x264_args:
+                # Hardware encoders can be compiled in without a usable device
+                self.logger.warning(f"Hardware encode failed, retrying with libx264: {result.stderr[-500:]}")
+                cmd = self._clip_extract_cmd(video_path, output_path, clip_start, clip_duration, x264_args)
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode == 0:
+                    # The encoder, not the source, was the problem: use libx264 from now on
+                    hw_encoder = encoder_args[encoder_args.index("-c:v") + 1]
+                    self.logger.warning(f"Disabling {hw_encoder} for later clips")
+                    ClipGenerator._failed_hw_encoders.add(hw_encoder)
+            
             if result.returncode != 0:
                 self.logger.error(f"ffmpeg error: {result.stderr}")
                 return None
@@ -554,12 +763,14 @@ class ClipGenerator:
         Returns:
             List of ClaimClip objects
         """
-        clips = []
-        
-        for i, claim in enumerate(claims):
-            clip = self.extract_claim_clip_ffmpeg(video_path, claim, output_dir, i)
-            if clip:
-                clips.append(clip)
+        # Each clip is an independent ffmpeg process; run a few at once, keeping claim order
+        workers = max(1, min(self.config.parallel_workers, len(claims)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda indexed: self.extract_claim_clip_ffmpeg(video_path, indexed[1], output_dir, indexed[0]),
+                enumerate(claims)
+            )
+            clips = [clip for clip in results if clip]
         
         self.logger.info(f"Extracted {len(clips)} claim clips")
         return clips
@@ -593,7 +804,7 @@ class ClipGenerator:
         output_path: str
     ) -> Optional[str]:
         """
-        Add text overlay with claim and verdict to a clip.
+        Add text overlay with claim and verdict to a clip in a single ffmpeg pass.
         
         The claim text appears in the middle 50% of the clip (starts at 25%, ends at 75%).
         The verdict badge appears for the full duration.
@@ -607,68 +818,62 @@ class ClipGenerator:
         Returns:
             Path to output clip
         """
-        if not MOVIEPY_AVAILABLE:
-            self.logger.warning("moviepy not available, skipping overlay")
-            return clip_path
-        
         try:
-            video = VideoFileClip(clip_path)
+            width, height, duration = self._probe_video(clip_path)
             
             # Calculate middle 50% timing
             # Overlay appears at 25% and disappears at 75% of clip duration
-            overlay_start = video.duration * 0.25
-            overlay_duration = video.duration * 0.50
+            overlay_start = duration * 0.25
+            overlay_end = duration * 0.75
+            in_window = _filter_escape(f"between(t,{overlay_start:.3f},{overlay_end:.3f})")
             
-            # Truncate claim text if too long
+            # Truncate claim text if too long, then wrap it to the frame width
             display_text = claim_text[:120] + "..." if len(claim_text) > 120 else claim_text
+            wrap_chars = max(10, int((width - 80) / (_CAPTION_FONT_SIZE * _AVG_GLYPH_WIDTH_EM)))
+            caption = "\n".join(textwrap.wrap(f'"{display_text}"', wrap_chars)) or '""'
+            
+            font = self._drawtext_font_option(self.config.overlay_font)
+            font = f"{font}:" if font else ""
+            verdict_color = self.get_verdict_color(verdict).replace('#', '0x')
+            
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                # Text goes through files so claim quotes, colons and % need no escaping
+                caption_file = os.path.join(tmp_dir, "caption.txt")
+                verdict_file = os.path.join(tmp_dir, "verdict.txt")
+                with open(caption_file, 'w', encoding='utf-8') as f:
+                    f.write(caption)
+                with open(verdict_file, 'w', encoding='utf-8') as f:
+                    f.write(verdict.replace('_', ' '))
+                
+                # Same layers as before, in one pass: verdict badge for the whole clip,
+                # then the semi-transparent band and claim caption in the middle 50%
+                filters = [
+                    f"drawtext={font}textfile={_filter_escape(verdict_file)}:expansion=none"
+                    f":fontsize={_VERDICT_FONT_SIZE}:fontcolor=white:x=80:y=60"
+                    f":box=1:boxcolor={verdict_color}:boxborderw=12",
+                    f"drawbox=x=0:y=ih-{_CAPTION_BAND_HEIGHT}:w=iw:h={_CAPTION_BAND_HEIGHT}"
+                    f":color=black@0.75:t=fill:enable={in_window}",
+                    f"drawtext={font}textfile={_filter_escape(caption_file)}:expansion=none"
+                    f":fontsize={_CAPTION_FONT_SIZE}:fontcolor={self.config.overlay_color}:line_spacing=8"
+                    f":x=(w-text_w)/2:y=h-{_CAPTION_BAND_HEIGHT - 20}:enable={in_window}",
+                ]
+                
+                cmd = [
+                    "ffmpeg", "-y",
+                    "-i", clip_path,
+                    "-vf", ",".join(filters),
+                    "-c:v", self.config.output_codec,
+                ]
+                # Preset and tune names are libx264's; other encoders reject them
+                if self.config.output_codec == "libx264":
+                    cmd += ["-preset", "ultrafast", "-tune", self.config.x264_tune]
+                cmd += ["-c:a", "copy", output_path]
+                
+                result = subprocess.run(cmd, capture_output=True, text=True)
             
-            # Create semi-transparent background for better readability
-            # Position it at the bottom portion of the screen - larger for bigger text
-            bg_height = 160
-            claim_bg = ColorClip(
-                size=(video.w, bg_height),
-                color=(0, 0, 0)
-            ).set_opacity(0.75).set_position(('center', video.h - bg_height)).set_start(overlay_start).set_duration(overlay_duration)
-            
-            # Create claim text overlay - LARGER font for clarity in tutorials
-            # Appears in middle 50% of clip
-            claim_fontsize = 36  # Larger for quick info clips
-            claim_txt = TextClip(
-                f'"{display_text}"',
-                fontsize=claim_fontsize,
-                color=self.config.overlay_color,
-                font=self.config.overlay_font,
-                method='caption',
-                size=(video.w - 80, None),
-                align='center'
-            ).set_position(('center', video.h - bg_height + 20)).set_start(overlay_start).set_duration(overlay_duration)
-            
-            # Create verdict badge - LARGER and positioned down-right for clarity
-            # Moved from (20, 20) to (80, 60) and larger font
-            verdict_color = self.get_verdict_color(verdict)
-            verdict_fontsize = 42  # Larger for visibility
-            verdict_txt = TextClip(
-                f"  {verdict.replace('_', ' ')}  ",
-                fontsize=verdict_fontsize,
-                color='white',
-                font=self.config.overlay_font,
-                bg_color=verdict_color,
-            ).set_position((80, 60)).set_duration(video.duration)
-            
-            # Composite all layers
-            final = CompositeVideoClip([video, verdict_txt, claim_bg, claim_txt])
-            
-            final.write_videofile(
-                output_path,
-                codec=self.config.output_codec,
-                audio_codec=self.config.output_audio_codec,
-                fps=self.config.output_fps,
-                preset="medium",
-                threads=4
-            )
-            
-            video.close()
-            final.close()
+            if result.returncode != 0:
+                self.logger.error(f"ffmpeg overlay error: {result.stderr}")
+                return clip_path
             
             self.logger.info(f"Added overlay to clip: {output_path}")
             return output_path
@@ -677,6 +882,40 @@ class ClipGenerator:
             self.logger.error(f"Error adding overlay: {e}")
             return clip_path
     
+    def _probe_video(self, video_path: str) -> Tuple[int, int, float]:
+        """Return (width, height, duration_seconds) of a video using ffprobe."""
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=width,height:format=duration",
+                "-of", "json",
+                video_path
+            ],
+            capture_output=True, text=True, check=True
+        )
+        info = json.loads(result.stdout)
+        stream = info["streams"][0]
+        return int(stream["width"]), int(stream["height"]), float(info["format"]["duration"])
+    
+    @classmethod
+    def _drawtext_font_option(cls, font: str) -> str:
+        """
+        Build the drawtext font option for a configured font.
+        
+        Paths are used as font files. Names like "Arial-Bold" become fontconfig
+        patterns ("Arial:style=Bold") when ffmpeg was built with fontconfig; otherwise
+        the font file the cards are rendered with is used. Returns "" if neither works.
+        """
+        if os.path.isfile(font):
+            return f"fontfile={_filter_escape(font)}"
+        if "--enable-libfontconfig" in cls._ffmpeg_build_configuration():
+            family, _, style = font.partition('-')
+            pattern = f"{family}:style={style}" if style else family
+            return f"font={_filter_escape(pattern)}"
+        font_file = _drawtext_fallback_font_file(font)
+        return f"fontfile={_filter_escape(font_file)}" if font_file else ""
+    
     def add_overlays_to_clips(
         self,
         clips: List[ClaimClip],
@@ -721,6 +960,84 @@ class ClipGenerator:
     # Tutorial Composer
     # =========================================================================
     
+    def _render_card_png(
+        self,
+        size: Tuple[int, int],
+        background: Tuple[int, int, int],
+        layers: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Render a static card to a PNG, reusing an earlier render of the same card.
+        
+        Each layer is a dict with "y" (pixels, or None to center vertically) and either
+        "text" (plus "font", "font_size", "color", optional "max_width" for wrapping and
+        "bg_color" for a badge) or "rect" (width, height) with "color".
+        
+        Args:
+            size: Card size (width, height)
+            background: Background RGB color
+            layers: Layers drawn in order on the background
+            
+        Returns:
+            Path to the PNG file
+        """
+        key = hashlib.sha1(json.dumps([size, background, layers], sort_keys=True).encode('utf-8')).hexdigest()
+        
+        png_path = os.path.join(_get_card_cache_dir(), f"{key}.png")
+        if os.path.exists(png_path):
+            return png_path
+        
+        image = Image.new('RGB', size, background)
+        draw = ImageDraw.Draw(image)
+        width, height = size
+        
+        for layer in layers:
+            if "rect" in layer:
+                rect_w, rect_h = layer["rect"]
+                x = (width - rect_w) // 2
+                draw.rectangle([x, layer["y"], x + rect_w - 1, layer["y"] + rect_h - 1], fill=layer["color"])
+                continue
+            
+            font = _load_card_font(layer["font"], layer["font_size"])
+            text = layer["text"]
+            if layer.get("max_width"):
+                text = self._wrap_card_text(draw, text, font, layer["max_width"])
+            
+            spacing = layer["font_size"] // 4
+            left, top, right, bottom = draw.multiline_textbbox((0, 0), text, font=font, spacing=spacing, align='center')
+            x = (width - (right - left)) / 2 - left
+            y = (height - (bottom - top)) / 2 - top if layer["y"] is None else layer["y"]
+            
+            if layer.get("bg_color"):
+                pad = layer["font_size"] // 2
+                draw.rectangle(
+                    [x + left - pad, y + top - pad // 2, x + right + pad, y + bottom + pad // 2],
+                    fill=layer["bg_color"]
+                )
+            draw.multiline_text((x, y), text, font=font, fill=layer["color"], spacing=spacing, align='center')
+        
+        # The directory is shared by every instance; publish the card in one rename
+        tmp_path = f"{png_path}.{threading.get_ident()}.tmp"
+        image.save(tmp_path, 'PNG', optimize=True)
+        os.replace(tmp_path, png_path)
+        return png_path
+    
+    @staticmethod
+    def _wrap_card_text(draw: Any, text: str, font: Any, max_width: int) -> str:
+        """Greedily wrap text so each line fits within max_width pixels."""
+        lines = []
+        for paragraph in text.split('\n'):
+            line = ""
+            for word in paragraph.split():
+                candidate = f"{line} {word}" if line else word
+                if line and draw.textlength(candidate, font=font) > max_width:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = candidate
+            lines.append(line)
+        return '\n'.join(lines)
+    
     def create_intro_card(
         self,
         title: str,
@@ -731,6 +1048,8 @@ class ClipGenerator:
         """
         Create an intro card clip.
         
+        The card is rendered once as a still image and shown for the whole duration.
+        
         Args:
             title: Main title text
             subtitle: Subtitle text
@@ -740,37 +1059,21 @@ class ClipGenerator:
         Returns:
             VideoClip for intro
         """
-        if not MOVIEPY_AVAILABLE:
+        if not MOVIEPY_AVAILABLE or not PIL_AVAILABLE:
             return None
         
         try:
-            # Background
-            bg = ColorClip(size=size, color=(26, 26, 26)).set_duration(duration)
-            
-            # Title
-            title_txt = TextClip(
-                title,
-                fontsize=48,
-                color='white',
-                font=self.config.overlay_font,
-                method='caption',
-                size=(size[0] - 100, None),
-                align='center'
-            ).set_position('center').set_duration(duration)
-            
-            # Subtitle
-            subtitle_txt = TextClip(
-                subtitle,
-                fontsize=28,
-                color='#cccccc',
-                font="Arial",
-                method='caption',
-                size=(size[0] - 100, None),
-                align='center'
-            ).set_position(('center', size[1] * 0.65)).set_duration(duration)
-            
-            intro = CompositeVideoClip([bg, title_txt, subtitle_txt])
-            return intro
+            layers = [
+                # Title
+                {"text": title, "font": self.config.overlay_font, "font_size": 48, "color": "white",
+                 "max_width": size[0] - 100, "y": None},
+                # Subtitle
+                {"text": subtitle, "font": "Arial", "font_size": 28, "color": "#cccccc",
+                 "max_width": size[0] - 100, "y": int(size[1] * 0.65)},
+            ]
+            
+            png_path = self._render_card_png(size, (26, 26, 26), layers)
+            return ImageClip(png_path).set_duration(duration)
             
         except Exception as e:
             self.logger.error(f"Error creating intro card: {e}")
@@ -809,14 +1112,11 @@ class ClipGenerator:
         Returns:
             VideoClip for transition card
         """
-        if not MOVIEPY_AVAILABLE:
+        if not MOVIEPY_AVAILABLE or not PIL_AVAILABLE:
             return None
         
         try:
-            # Dark background
-            bg = ColorClip(size=size, color=(20, 20, 25)).set_duration(duration)
-            
-            layers = [bg]
+            layers = []
             
             # Video ID bar at top
             video_label = f"Video: {video_id}"
@@ -825,89 +1125,42 @@ class ClipGenerator:
                 display_title = video_title[:60] + "..." if len(video_title) > 60 else video_title
                 video_label = f"{display_title}\n({video_id})"
             
-            video_txt = TextClip(
-                video_label,
-                fontsize=22,
-                color='#888888',
-                font="Arial",
-                method='caption',
-                size=(size[0] - 100, None),
-                align='center'
-            ).set_position(('center', 30)).set_duration(duration)
-            layers.append(video_txt)
+            layers.append({"text": video_label, "font": "Arial", "font_size": 22, "color": "#888888",
+                           "max_width": size[0] - 100, "y": 30})
             
             # Claim number header - large and prominent
-            claim_header = f"CLAIM {claim_number} of {total_claims}"
-            header_txt = TextClip(
-                claim_header,
-                fontsize=56,
-                color='white',
-                font=self.config.overlay_font,
-            ).set_position(('center', size[1] * 0.15)).set_duration(duration)
-            layers.append(header_txt)
+            layers.append({"text": f"CLAIM {claim_number} of {total_claims}", "font": self.config.overlay_font,
+                           "font_size": 56, "color": "white", "y": int(size[1] * 0.15)})
             
             # Timestamp
-            timestamp_txt = TextClip(
-                f"⏱  {clip.timestamp_str}",
-                fontsize=32,
-                color='#aaaaaa',
-                font="Arial",
-            ).set_position(('center', size[1] * 0.28)).set_duration(duration)
-            layers.append(timestamp_txt)
+            layers.append({"text": f"⏱  {clip.timestamp_str}", "font": "Arial", "font_size": 32,
+                           "color": "#aaaaaa", "y": int(size[1] * 0.28)})
             
             # Claim text - centered, wrapped
             display_claim = clip.claim_text[:200] + "..." if len(clip.claim_text) > 200 else clip.claim_text
-            claim_txt = TextClip(
-                f'"{display_claim}"',
-                fontsize=30,
-                color='white',
-                font="Arial",
-                method='caption',
-                size=(size[0] - 200, None),
-                align='center'
-            ).set_position(('center', size[1] * 0.40)).set_duration(duration)
-            layers.append(claim_txt)
+            layers.append({"text": f'"{display_claim}"', "font": "Arial", "font_size": 30, "color": "white",
+                           "max_width": size[0] - 200, "y": int(size[1] * 0.40)})
             
             # Verdict with colored background
-            verdict_color = self.get_verdict_color(clip.verdict)
-            verdict_display = clip.verdict.replace('_', ' ')
-            verdict_txt = TextClip(
-                f"  {verdict_display}  ",
-                fontsize=36,
-                color='white',
-                font=self.config.overlay_font,
-                bg_color=verdict_color,
-            ).set_position(('center', size[1] * 0.65)).set_duration(duration)
-            layers.append(verdict_txt)
+            layers.append({"text": clip.verdict.replace('_', ' '), "font": self.config.overlay_font,
+                           "font_size": 36, "color": "white", "bg_color": self.get_verdict_color(clip.verdict),
+                           "y": int(size[1] * 0.65)})
             
             # FALSE probability percentage
             false_pct = clip.false_probability * 100
-            pct_txt = TextClip(
-                f"FALSE Probability: {false_pct:.1f}%",
-                fontsize=28,
-                color='#ff6b6b' if false_pct > 50 else '#aaaaaa',
-                font="Arial",
-            ).set_position(('center', size[1] * 0.75)).set_duration(duration)
-            layers.append(pct_txt)
+            layers.append({"text": f"FALSE Probability: {false_pct:.1f}%", "font": "Arial", "font_size": 28,
+                           "color": '#ff6b6b' if false_pct > 50 else '#aaaaaa', "y": int(size[1] * 0.75)})
             
             # Separator line visual (using a thin colored bar)
-            separator = ColorClip(
-                size=(size[0] - 400, 2), 
-                color=(80, 80, 80)
-            ).set_position(('center', size[1] * 0.85)).set_duration(duration)
-            layers.append(separator)
+            layers.append({"rect": (size[0] - 400, 2), "color": (80, 80, 80), "y": int(size[1] * 0.85)})
             
             # "Playing clip..." indicator at bottom
-            play_txt = TextClip(
-                "▶  Playing clip...",
-                fontsize=20,
-                color='#666666',
-                font="Arial",
-            ).set_position(('center', size[1] * 0.90)).set_duration(duration)
-            layers.append(play_txt)
+            layers.append({"text": "▶  Playing clip...", "font": "Arial", "font_size": 20, "color": "#666666",
+                           "y": int(size[1] * 0.90)})
             
-            transition = CompositeVideoClip(layers)
-            return transition
+            # Dark background
+            png_path = self._render_card_png(size, (20, 20, 25), layers)
+            return ImageClip(png_path).set_duration(duration)
             
         except Exception as e:
             self.logger.error(f"Error creating claim transition card: {e}")
@@ -1099,7 +1352,7 @@ class ClipGenerator:
                 return result
             
             # Step 4: Add overlays (optional)
-            if add_overlays and MOVIEPY_AVAILABLE:
+            if add_overlays:
                 overlays_dir = os.path.join(output_dir, "clips_with_overlays")
                 self.logger.info("🎨 Adding text overlays")
                 clips = self.add_overlays_to_clips(clips, overlays_dir)